@@ -5,19 +5,84 @@ Fixtures specific to analysis_service module testing
 """
 import os
 import sys
+import shutil
 import pytest
+from collections import defaultdict
+from functools import lru_cache
 from typing import Generator, Dict, Any
 from unittest.mock import MagicMock, patch
 from datetime import datetime, timezone
 
-# Add project paths
-PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add project paths (resolved once; skip entries the root conftest already added)
+PROJECT_ROOT = os.path.abspath(__file__).rsplit(os.sep, 3)[0]
 ANALYSIS_SERVICE_PATH = os.path.join(PROJECT_ROOT, 'sub_system', 'analysis_service')
-sys.path.insert(0, PROJECT_ROOT)
-sys.path.insert(0, ANALYSIS_SERVICE_PATH)
+for _path in (PROJECT_ROOT, ANALYSIS_SERVICE_PATH):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
 
 # Import mock classes
 from CI_test.mocks.mock_mongodb import MockDatabase
+from CI_test.mocks.wav import build_silent_wav
+
+# Fixed clock used by the sample fixtures and mock pipeline
+FIXED_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture(scope="session")
+def fixed_now() -> datetime:
+    """Fixed 2024-01-01 UTC time for analysis fixtures (the root frozen_now reads the clock)"""
+    return FIXED_NOW
+
+
+@pytest.fixture(scope="session")
+def fixed_now_iso(fixed_now: datetime) -> str:
+    """ISO-8601 form of fixed_now"""
+    return fixed_now.isoformat()
+
+
+@pytest.fixture(scope="module")
+def temp_model_dir(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """
+    Model cache directory shared by all tests in a module
+
+    Pair with _clean_model_dir so each test starts from an empty directory.
+    tmp_path_factory keeps the directory private to each xdist worker.
+    """
+    return str(tmp_path_factory.mktemp('ci_test_models_'))
+
+
+@pytest.fixture
+def _clean_model_dir(temp_model_dir: str) -> str:
+    """Empty the module-scoped temp_model_dir before a test runs"""
+    for entry in os.scandir(temp_model_dir):
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path, ignore_errors=True)
+        else:
+            os.remove(entry.path)
+    return temp_model_dir
+
+
+@pytest.fixture(scope="module")
+def prewritten_model_file(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """
+    Canonical model file written once per module (read-only)
+
+    Lives outside temp_model_dir so _clean_model_dir never removes it.
+    """
+    model_path = tmp_path_factory.mktemp('ci_test_prewritten_') / 'model.onnx'
+    model_path.write_bytes(b'ONNX model content')
+    return str(model_path)
+
+
+@pytest.fixture(scope="session")
+def sample_wav_content() -> bytes:
+    """
+    Small sample WAV for analysis tests
+
+    Overrides the 1 s root sample with a valid 16 kHz mono header and
+    1000 samples (~2 KB), enough for multi-chunk reads.
+    """
+    return build_silent_wav(16000, 1, 1000 / 16000)
 
 
 @pytest.fixture
@@ -30,6 +95,36 @@ def mock_get_db(mock_database):
     yield mock_database
 
 
+class MockGridFSFile:
+    """File-like object returned by the mock GridFS handler"""
+
+    def __init__(self, data, file_id, filename, metadata=None):
+        self._data = data
+        self._id = file_id
+        self.filename = filename
+        self.metadata = metadata.get('metadata', {}) if metadata else {}
+        self.length = len(data)
+        self.upload_date = datetime.now(timezone.utc)
+        self._position = 0
+
+    def read(self, size=-1):
+        if self._position >= len(self._data):
+            return b''
+        if size == -1:
+            result = self._data[self._position:]
+            self._position = len(self._data)
+        else:
+            result = self._data[self._position:self._position + size]
+            self._position += size
+        return result
+
+    def seek(self, position):
+        self._position = position
+
+    def tell(self):
+        return self._position
+
+
 @pytest.fixture
 def mock_gridfs_handler():
     """
@@ -37,33 +132,7 @@ def mock_gridfs_handler():
     """
     handler = MagicMock()
     handler._files = {}
-
-    class MockGridFSFile:
-        def __init__(self, data, file_id, filename, metadata=None):
-            self._data = data
-            self._id = file_id
-            self.filename = filename
-            self.metadata = metadata.get('metadata', {}) if metadata else {}
-            self.length = len(data)
-            self.upload_date = datetime.now(timezone.utc)
-            self._position = 0
-
-        def read(self, size=-1):
-            if self._position >= len(self._data):
-                return b''
-            if size == -1:
-                result = self._data[self._position:]
-                self._position = len(self._data)
-            else:
-                result = self._data[self._position:self._position + size]
-                self._position += size
-            return result
-
-        def seek(self, position):
-            self._position = position
-
-        def tell(self):
-            return self._position
+    handler._by_filename = defaultdict(list)
 
     def put(data: bytes, filename: str = None, **kwargs):
         file_id = f"file-{len(handler._files) + 1}"
@@ -73,8 +142,12 @@ def mock_gridfs_handler():
             'metadata': kwargs.get('metadata', {}),
             'upload_date': datetime.now(timezone.utc)
         }
+        handler._by_filename[filename].append(file_id)
         return file_id
 
+    def put_many(contents: list, filenames: list, **kwargs):
+        return [put(data, filename=filename, **kwargs) for data, filename in zip(contents, filenames)]
+
     def get(file_id: str):
         if file_id in handler._files:
             file_data = handler._files[file_id]
@@ -88,7 +161,7 @@ def mock_gridfs_handler():
 
     def delete(file_id: str):
         if file_id in handler._files:
-            del handler._files[file_id]
+            handler._by_filename[handler._files.pop(file_id)['filename']].remove(file_id)
             return True
         return False
 
@@ -96,16 +169,16 @@ def mock_gridfs_handler():
         if file_id:
             return file_id in handler._files
         if filename:
-            for fdata in handler._files.values():
-                if fdata['filename'] == filename:
-                    return True
-            return False
+            return bool(handler._by_filename.get(filename))
         return False
 
     def list_files():
         return list(handler._files.keys())
 
     def find(query: dict = None):
+        if query is not None and query.keys() == {'filename'}:
+            return iter([get(fid) for fid in handler._by_filename.get(query['filename'], [])])
+
         results = []
         for fid, fdata in handler._files.items():
             if query is None:
@@ -126,13 +199,11 @@ def mock_gridfs_handler():
         return iter(results)
 
     def find_one(query: dict):
-        filename = query.get('filename')
-        for fid, fdata in handler._files.items():
-            if fdata['filename'] == filename:
-                return get(fid)
-        return None
+        file_ids = handler._by_filename.get(query.get('filename'))
+        return get(file_ids[0]) if file_ids else None
 
     handler.put = put
+    handler.put_many = put_many
     handler.get = get
     handler.delete = delete
     handler.exists = exists
@@ -143,16 +214,8 @@ def mock_gridfs_handler():
     return handler
 
 
-@pytest.fixture
-def mock_analysis_pipeline():
-    """
-    Mock AnalysisPipeline for testing
-
-    Usage:
-        def test_analysis(mock_analysis_pipeline):
-            result = mock_analysis_pipeline.process(task_data)
-    """
-    pipeline = MagicMock()
+def _configure_pipeline(pipeline: MagicMock, processed_at: str) -> MagicMock:
+    """Give a fresh MagicMock the AnalysisPipeline surface"""
 
     def process(recording_data, config, model_cache=None):
         return {
@@ -161,7 +224,7 @@ def mock_analysis_pipeline():
                 'classification': 'normal',
                 'confidence': 0.95,
             },
-            'processed_at': datetime.now(timezone.utc).isoformat(),
+            'processed_at': processed_at,
         }
 
     pipeline.process = process
@@ -170,6 +233,32 @@ def mock_analysis_pipeline():
     return pipeline
 
 
+@pytest.fixture
+def mock_analysis_pipeline(fixed_now_iso: str):
+    """
+    Mock AnalysisPipeline for testing
+
+    Usage:
+        def test_analysis(mock_analysis_pipeline):
+            result = mock_analysis_pipeline.process(task_data)
+    """
+    return _configure_pipeline(MagicMock(), fixed_now_iso)
+
+
+def _download_model(file_id: str, destination: str):
+    return True
+
+
+class _LruCacheView:
+    """Sized view over an lru_cache so tests can len() the cached models"""
+
+    def __init__(self, cached_func):
+        self._cached_func = cached_func
+
+    def __len__(self) -> int:
+        return self._cached_func.cache_info().currsize
+
+
 @pytest.fixture
 def mock_model_cache():
     """
@@ -180,37 +269,21 @@ def mock_model_cache():
             model = mock_model_cache.get_model('config-001', 'onnx_model')
     """
     cache = MagicMock()
-    cache._cached_models = {}
+    cache.download_model = _download_model
 
+    @lru_cache(maxsize=None)
     def get_model(config_id: str, model_key: str):
-        cache_key = f"{config_id}:{model_key}"
-        if cache_key not in cache._cached_models:
-            cache._cached_models[cache_key] = MagicMock(name=f'MockModel_{cache_key}')
-        return cache._cached_models[cache_key]
-
-    def download_model(file_id: str, destination: str):
-        return True
-
-    def clear_cache():
-        cache._cached_models.clear()
+        return MagicMock(name=f'MockModel_{config_id}:{model_key}')
 
     cache.get_model = get_model
-    cache.download_model = download_model
-    cache.clear_cache = clear_cache
+    cache.clear_cache = get_model.cache_clear
+    cache._cached_models = _LruCacheView(get_model)
 
     return cache
 
 
-@pytest.fixture
-def mock_node_manager():
-    """
-    Mock MongoDBNodeManager for testing
-
-    Usage:
-        def test_node_registration(mock_node_manager):
-            mock_node_manager.register_node()
-    """
-    manager = MagicMock()
+def _configure_node_manager(manager: MagicMock) -> MagicMock:
+    """Give a fresh MagicMock the MongoDBNodeManager surface"""
     manager.node_id = 'test-node-001'
     manager.capabilities = ['audio_classification', 'anomaly_detection']
     manager.current_tasks = 0
@@ -222,21 +295,33 @@ def mock_node_manager():
     def update_heartbeat():
         return True
 
-    def update_task_count(delta: int):
-        manager.current_tasks = max(0, manager.current_tasks + delta)
+    def unregister_node():
         return True
 
-    def unregister_node():
+    def update_task_count(delta: int):
+        manager.current_tasks = max(0, manager.current_tasks + delta)
         return True
 
     manager.register_node = register_node
     manager.update_heartbeat = update_heartbeat
-    manager.update_task_count = update_task_count
     manager.unregister_node = unregister_node
+    manager.update_task_count = update_task_count
 
     return manager
 
 
+@pytest.fixture
+def mock_node_manager():
+    """
+    Mock MongoDBNodeManager for testing
+
+    Usage:
+        def test_node_registration(mock_node_manager):
+            mock_node_manager.register_node()
+    """
+    return _configure_node_manager(MagicMock())
+
+
 @pytest.fixture
 def mock_gridfs_analysis_handler(mock_gridfs_handler):
     """
@@ -259,9 +344,13 @@ def mock_gridfs_analysis_handler(mock_gridfs_handler):
     return handler
 
 
-@pytest.fixture
-def sample_analysis_task() -> Dict[str, Any]:
-    """Sample analysis task data"""
+@pytest.fixture(scope="session")
+def sample_analysis_task(fixed_now_iso: str) -> Dict[str, Any]:
+    """
+    Sample analysis task data
+
+    Session-scoped and shared by every test; copy it with dict() before mutating.
+    """
     return {
         'task_id': 'task-analysis-001',
         'recording_id': 'rec-001',
@@ -271,13 +360,17 @@ def sample_analysis_task() -> Dict[str, Any]:
         'mongodb_instance': 'default',
         'priority': 5,
         'retry_count': 0,
-        'created_at': datetime.now(timezone.utc).isoformat(),
+        'created_at': fixed_now_iso,
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_recording_for_analysis() -> Dict[str, Any]:
-    """Sample recording document for analysis"""
+    """
+    Sample recording document for analysis
+
+    Session-scoped and shared by every test; copy it with dict() before mutating.
+    """
     return {
         '_id': 'rec-analysis-001',
         'recording_uuid': 'uuid-001-002-003',
@@ -291,9 +384,14 @@ def sample_recording_for_analysis() -> Dict[str, Any]:
     }
 
 
-@pytest.fixture
-def sample_analysis_result() -> Dict[str, Any]:
-    """Sample analysis result"""
+@pytest.fixture(scope="session")
+def sample_analysis_result(fixed_now: datetime) -> Dict[str, Any]:
+    """
+    Sample analysis result
+
+    Session-scoped and shared by every test; copy.deepcopy() it before mutating
+    the nested results.
+    """
     return {
         'recording_id': 'rec-001',
         'task_id': 'task-001',
@@ -307,7 +405,7 @@ def sample_analysis_result() -> Dict[str, Any]:
             ],
         },
         'processing_time_ms': 1234,
-        'completed_at': datetime.now(timezone.utc),
+        'completed_at': fixed_now,
     }
 
 
@@ -316,25 +414,35 @@ def analysis_configs_in_db(mock_get_db, sample_analysis_config):
     """Pre-populate database with analysis configurations"""
     configs_collection = mock_get_db['analysis_configs']
 
-    configs_collection.insert_one(sample_analysis_config)
-
-    # Add alternative config
+    # Alternative config
     alt_config = sample_analysis_config.copy()
     alt_config['config_id'] = 'anomaly-detection-001'
     alt_config['config_name'] = 'Anomaly Detection'
     alt_config['analysis_method_id'] = 'anomaly_detection'
-    configs_collection.insert_one(alt_config)
+
+    configs_collection.insert_many([sample_analysis_config, alt_config])
 
     return mock_get_db
 
 
 @pytest.fixture
 def task_logs_collection(mock_get_db):
-    """Get task execution logs collection"""
-    return mock_get_db['task_execution_logs']
+    """Get task execution logs collection (indexed on task_id)"""
+    collection = mock_get_db['task_execution_logs']
+    collection.create_index('task_id')
+    return collection
 
 
 @pytest.fixture
 def node_status_collection(mock_get_db):
-    """Get node status collection"""
-    return mock_get_db['node_status']
+    """
+    Get node status collection
+
+    Indexed on node_id, plus (status, last_heartbeat) for stale-node queries.
+    Project to {'node_id': 1, '_id': 0} when only ids are needed; the mock
+    then copies just that field, like a covered query in MongoDB.
+    """
+    collection = mock_get_db['node_status']
+    collection.create_index('node_id')
+    collection.create_index([('status', 1), ('last_heartbeat', 1)])
+    return collection
@@ -7,139 +7,96 @@ Tests cover:
 - Duration calculation
 """
 import pytest
+import numpy as np
 from unittest.mock import MagicMock, patch
 
+pytestmark = pytest.mark.unit
 
-class TestAudioSlicing:
-    """Test audio slicing functionality"""
 
-    @pytest.mark.unit
-    def test_calculate_slice_count(self):
-        """Test calculating number of slices"""
-        total_duration = 60.0  # seconds
-        slice_duration = 10.0  # seconds
-        overlap = 0.5  # 50% overlap
+def _generate_slice_windows(total_duration: float, slice_duration: float, overlap: float) -> np.ndarray:
+    """
+    Build the (start, end) window of every slice in one vectorized pass
 
-        step = slice_duration * (1 - overlap)
-        num_slices = int((total_duration - slice_duration) / step) + 1
+    Returns an array of shape (num_slices, 2); only windows that fit
+    entirely inside total_duration are produced.
+    """
+    step = slice_duration * (1 - overlap)
+    starts = np.arange(0.0, total_duration - slice_duration + 1e-9, step)
+    return np.stack([starts, starts + slice_duration], axis=1)
 
-        assert num_slices > 0
 
-    @pytest.mark.unit
-    def test_slice_short_audio(self):
-        """Test slicing audio shorter than slice duration"""
-        total_duration = 5.0
-        slice_duration = 10.0
+def _count_slices(total_duration: float, slice_duration: float, overlap: float) -> int:
+    """
+    Closed-form slice count; audio shorter than one slice is padded to a single slice
+    """
+    step = slice_duration * (1 - overlap)
+    return max(1, int((total_duration - slice_duration) / step) + 1)
 
-        if total_duration < slice_duration:
-            # Pad or use as single slice
-            num_slices = 1
-        else:
-            num_slices = int(total_duration / slice_duration)
 
-        assert num_slices == 1
+class TestAudioSlicing:
+    """Test audio slicing functionality"""
 
-    @pytest.mark.unit
-    def test_slice_exact_multiple(self):
-        """Test slicing when duration is exact multiple"""
-        total_duration = 30.0
-        slice_duration = 10.0
-        overlap = 0.0
+    @pytest.mark.parametrize("total_duration, slice_duration, overlap, expected", [
+        (60.0, 10.0, 0.5, 11),  # 50% overlap
+        (5.0, 10.0, 0.0, 1),    # Shorter than one slice: padded to a single slice
+        (30.0, 10.0, 0.0, 3),   # Exact multiple
+    ])
+    def test_calculate_slice_count(self, total_duration, slice_duration, overlap, expected):
+        """Test calculating number of slices"""
+        num_slices = _count_slices(total_duration, slice_duration, overlap)
+        windows = _generate_slice_windows(total_duration, slice_duration, overlap)
 
-        num_slices = int(total_duration / slice_duration)
-        assert num_slices == 3
+        assert num_slices == expected
+        assert num_slices == max(1, len(windows))
 
-    @pytest.mark.unit
     def test_generate_slice_timestamps(self):
         """Test generating slice start/end timestamps"""
         total_duration = 30.0
         slice_duration = 10.0
         overlap = 0.0
 
-        slices = []
-        start = 0.0
-        while start + slice_duration <= total_duration:
-            slices.append({
-                'start': start,
-                'end': start + slice_duration,
-                'index': len(slices),
-            })
-            start += slice_duration
+        slices = _generate_slice_windows(total_duration, slice_duration, overlap)
 
         assert len(slices) == 3
-        assert slices[0]['start'] == 0.0
-        assert slices[0]['end'] == 10.0
+        assert slices[0, 0] == 0.0
+        assert slices[0, 1] == 10.0
 
 
 class TestOverlapHandling:
     """Test overlap handling in slicing"""
 
-    @pytest.mark.unit
-    def test_50_percent_overlap(self):
-        """Test 50% overlap slicing"""
+    @pytest.mark.parametrize("overlap, expected_step, expected_count", [
+        (0.5, 5.0, 5),    # Slices at 0, 5, 10, 15, 20
+        (0.0, 10.0, 3),   # No overlap
+        (0.75, 2.5, 9),   # High overlap
+    ])
+    def test_overlap_slicing(self, overlap, expected_step, expected_count):
+        """Test step size and slice count for each overlap ratio"""
         total_duration = 30.0
         slice_duration = 10.0
-        overlap = 0.5
-
-        step = slice_duration * (1 - overlap)  # 5 seconds
-        num_slices = int((total_duration - slice_duration) / step) + 1
-
-        assert step == 5.0
-        assert num_slices == 5  # Slices at 0, 5, 10, 15, 20
-
-    @pytest.mark.unit
-    def test_no_overlap(self):
-        """Test no overlap slicing"""
-        total_duration = 30.0
-        slice_duration = 10.0
-        overlap = 0.0
 
         step = slice_duration * (1 - overlap)
-        num_slices = int((total_duration - slice_duration) / step) + 1
-
-        assert step == 10.0
-        assert num_slices == 3
+        num_slices = _count_slices(total_duration, slice_duration, overlap)
 
-    @pytest.mark.unit
-    def test_high_overlap(self):
-        """Test high overlap (75%) slicing"""
-        total_duration = 30.0
-        slice_duration = 10.0
-        overlap = 0.75
-
-        step = slice_duration * (1 - overlap)  # 2.5 seconds
-        num_slices = int((total_duration - slice_duration) / step) + 1
+        assert step == expected_step
+        assert num_slices == expected_count
 
-        assert step == 2.5
-        assert num_slices == 9
-
-    @pytest.mark.unit
     def test_generate_overlapping_slices(self):
         """Test generating overlapping slice list"""
         total_duration = 20.0
         slice_duration = 10.0
         overlap = 0.5
 
-        step = slice_duration * (1 - overlap)
-        slices = []
-        start = 0.0
-
-        while start + slice_duration <= total_duration:
-            slices.append({
-                'start': start,
-                'end': start + slice_duration,
-            })
-            start += step
+        slices = _generate_slice_windows(total_duration, slice_duration, overlap)
 
         # Should have slices at 0, 5, 10
         assert len(slices) == 3
-        assert slices[1]['start'] == 5.0
+        assert slices[1, 0] == 5.0
 
 
 class TestDurationCalculation:
     """Test duration calculation"""
 
-    @pytest.mark.unit
     def test_calculate_duration_from_samples(self):
         """Test calculating duration from sample count"""
         sample_rate = 16000
@@ -148,7 +105,6 @@ class TestDurationCalculation:
         duration = num_samples / sample_rate
         assert duration == 10.0
 
-    @pytest.mark.unit
     def test_slice_sample_indices(self):
         """Test calculating sample indices for slice"""
         sample_rate = 16000
@@ -166,7 +122,6 @@ class TestDurationCalculation:
 class TestSliceOutput:
     """Test slice output format"""
 
-    @pytest.mark.unit
     def test_slice_metadata(self):
         """Test slice metadata structure"""
         slice_meta = {
@@ -182,19 +137,14 @@ class TestSliceOutput:
         assert 'index' in slice_meta
         assert slice_meta['duration'] == slice_meta['end_time'] - slice_meta['start_time']
 
-    @pytest.mark.unit
     def test_multiple_slices_coverage(self):
         """Test that slices cover entire audio"""
         total_duration = 30.0
         slice_duration = 10.0
         overlap = 0.0
 
-        slices = []
-        start = 0.0
-        while start + slice_duration <= total_duration:
-            slices.append((start, start + slice_duration))
-            start += slice_duration
+        slices = _generate_slice_windows(total_duration, slice_duration, overlap)
 
         # Check coverage
-        covered = sum(end - start for start, end in slices)
+        covered = float((slices[:, 1] - slices[:, 0]).sum())
         assert covered == total_duration
@@ -7,25 +7,26 @@ Tests cover:
 - Configuration application
 """
 import pytest
+import numpy as np
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+pytestmark = pytest.mark.unit
+
 
 class TestFeatureExtraction:
     """Test LEAF feature extraction"""
 
-    @pytest.mark.unit
     def test_feature_shape(self):
         """Test extracted feature shape"""
         # Mock feature output
         time_steps = 100
         n_mels = 64
 
-        features = [[0.0] * n_mels for _ in range(time_steps)]
+        features = np.zeros((time_steps, n_mels), dtype=np.float32)
 
-        assert len(features) == time_steps
-        assert len(features[0]) == n_mels
+        assert features.shape == (time_steps, n_mels)
 
-    @pytest.mark.unit
     def test_feature_values_normalized(self):
         """Test feature values are normalized"""
         # Mock normalized features
@@ -38,25 +39,20 @@ class TestFeatureExtraction:
             for val in row:
                 assert 0.0 <= val <= 1.0
 
-    @pytest.mark.unit
     def test_batch_feature_extraction(self):
         """Test extracting features for batch of slices"""
         batch_size = 5
         time_steps = 100
         n_mels = 64
 
-        batch_features = [
-            [[0.0] * n_mels for _ in range(time_steps)]
-            for _ in range(batch_size)
-        ]
+        batch_features = np.zeros((batch_size, time_steps, n_mels), dtype=np.float32)
 
-        assert len(batch_features) == batch_size
+        assert batch_features.shape == (batch_size, time_steps, n_mels)
 
 
 class TestFeatureConfiguration:
     """Test feature extraction configuration"""
 
-    @pytest.mark.unit
     def test_mel_spectrogram_params(self, sample_analysis_config):
         """Test mel spectrogram parameters"""
         params = sample_analysis_config['parameters']
@@ -68,7 +64,6 @@ class TestFeatureConfiguration:
         assert default_n_mels > 0
         assert default_n_fft > 0
 
-    @pytest.mark.unit
     def test_window_params(self, sample_analysis_config):
         """Test window parameters"""
         params = sample_analysis_config['parameters']
@@ -80,7 +75,6 @@ class TestFeatureConfiguration:
         assert window_stride > 0
         assert window_stride <= window_size
 
-    @pytest.mark.unit
     def test_sample_rate_config(self, sample_analysis_config):
         """Test sample rate configuration"""
         params = sample_analysis_config['parameters']
@@ -92,7 +86,6 @@ class TestFeatureConfiguration:
 class TestFeatureOutput:
     """Test feature output format"""
 
-    @pytest.mark.unit
     def test_output_dimensions(self):
         """Test output feature dimensions"""
         # Typical LEAF output shape: (batch, time, features)
@@ -105,7 +98,6 @@ class TestFeatureOutput:
         assert output_shape[0] == batch_size
         assert output_shape[2] == feature_dim
 
-    @pytest.mark.unit
     def test_feature_dtype(self):
         """Test feature data type"""
         # Features should be float
@@ -114,7 +106,6 @@ class TestFeatureOutput:
         for f in features:
             assert isinstance(f, float)
 
-    @pytest.mark.unit
     def test_feature_metadata(self):
         """Test feature metadata"""
         metadata = {
@@ -132,31 +123,25 @@ class TestFeatureOutput:
 class TestLEAFModel:
     """Test LEAF model integration"""
 
-    @pytest.mark.unit
     def test_model_initialization(self):
         """Test LEAF model initialization mock"""
-        mock_model = MagicMock()
-        mock_model.sample_rate = 16000
-        mock_model.n_filters = 64
+        mock_model = SimpleNamespace(sample_rate=16000, n_filters=64)
 
         assert mock_model.sample_rate == 16000
 
-    @pytest.mark.unit
     def test_model_forward_pass(self):
         """Test LEAF model forward pass mock"""
         mock_model = MagicMock()
 
         # Mock input (batch, channels, samples)
         input_shape = (4, 1, 16000)  # 1 second audio
-        mock_output = MagicMock()
-        mock_output.shape = (4, 100, 64)  # (batch, time, features)
+        mock_output = SimpleNamespace(shape=(4, 100, 64))  # (batch, time, features)
 
         mock_model.return_value = mock_output
         result = mock_model()
 
         assert result.shape == (4, 100, 64)
 
-    @pytest.mark.unit
     def test_gpu_vs_cpu_inference(self):
         """Test GPU vs CPU inference selection"""
         use_gpu = False  # Default for testing
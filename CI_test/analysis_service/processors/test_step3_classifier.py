@@ -7,78 +7,83 @@ Tests cover:
 - Result aggregation
 """
 import pytest
+import numpy as np
+from collections import defaultdict
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(scope="session")
+def sample_predictions():
+    """Single-slice classifier output shared by the prediction tests (read-only)"""
+    return [
+        {'label': 'anomaly', 'score': 0.10},
+        {'label': 'normal', 'score': 0.85},
+        {'label': 'unknown', 'score': 0.05},
+    ]
+
 
 class TestClassificationPrediction:
     """Test classification prediction"""
 
-    @pytest.mark.unit
-    def test_prediction_output_format(self):
+    @pytest.mark.parametrize("field", ['label', 'score'])
+    def test_prediction_output_format(self, sample_predictions, field):
         """Test prediction output format"""
-        predictions = [
-            {'label': 'normal', 'score': 0.85},
-            {'label': 'anomaly', 'score': 0.10},
-            {'label': 'unknown', 'score': 0.05},
-        ]
-
-        assert len(predictions) > 0
-        assert 'label' in predictions[0]
-        assert 'score' in predictions[0]
+        assert len(sample_predictions) > 0
+        assert all(field in p for p in sample_predictions)
 
-    @pytest.mark.unit
-    def test_prediction_scores_sum_to_one(self):
+    def test_prediction_scores_sum_to_one(self, sample_predictions):
         """Test prediction scores sum to approximately 1"""
-        predictions = [
-            {'label': 'normal', 'score': 0.85},
-            {'label': 'anomaly', 'score': 0.10},
-            {'label': 'unknown', 'score': 0.05},
-        ]
-
-        total = sum(p['score'] for p in predictions)
+        total = sum(p['score'] for p in sample_predictions)
         assert abs(total - 1.0) < 0.01
 
-    @pytest.mark.unit
-    def test_get_top_prediction(self):
+    def test_get_top_prediction(self, sample_predictions):
         """Test getting top prediction"""
-        predictions = [
-            {'label': 'anomaly', 'score': 0.10},
-            {'label': 'normal', 'score': 0.85},
-            {'label': 'unknown', 'score': 0.05},
-        ]
+        # Labels and scores kept as parallel arrays so the pick is one argmax
+        labels = np.array([p['label'] for p in sample_predictions])
+        scores = np.array([p['score'] for p in sample_predictions], dtype=np.float32)
 
-        top_prediction = max(predictions, key=lambda x: x['score'])
-        assert top_prediction['label'] == 'normal'
-        assert top_prediction['score'] == 0.85
+        top_index = int(scores.argmax())
+        top_label, top_score = labels[top_index], scores[top_index]
+
+        assert top_label == 'normal'
+        assert top_score == np.float32(0.85)
 
-    @pytest.mark.unit
     def test_batch_predictions(self):
         """Test predictions for batch of slices"""
         batch_size = 5
         num_classes = 3
 
-        # Mock batch predictions
-        batch_predictions = [
+        # Mock batch predictions, one row per slice
+        batch_predictions = np.asarray([
             [0.85, 0.10, 0.05],  # Slice 0
             [0.90, 0.07, 0.03],  # Slice 1
             [0.75, 0.20, 0.05],  # Slice 2
             [0.88, 0.08, 0.04],  # Slice 3
             [0.82, 0.12, 0.06],  # Slice 4
-        ]
+        ], dtype=np.float32)
+
+        assert batch_predictions.shape == (batch_size, num_classes)
+
+        # Per-slice top class and per-class mean score in single reductions
+        top_classes = np.argmax(batch_predictions, axis=1)
+        mean_scores = np.mean(batch_predictions, axis=0)
 
-        assert len(batch_predictions) == batch_size
-        assert len(batch_predictions[0]) == num_classes
+        assert top_classes.tolist() == [0, 0, 0, 0, 0]
+        assert int(np.argmax(mean_scores)) == 0
+        assert abs(float(mean_scores[0]) - 0.84) < 0.01
 
 
 class TestModelLoading:
     """Test model loading functionality"""
 
-    @pytest.mark.unit
     def test_onnx_model_load_mock(self):
         """Test ONNX model loading mock"""
         mock_session = MagicMock()
-        mock_session.get_inputs.return_value = [MagicMock(name='input', shape=[1, 100, 64])]
-        mock_session.get_outputs.return_value = [MagicMock(name='output', shape=[1, 3])]
+        mock_session.get_inputs.return_value = [SimpleNamespace(name='input', shape=[1, 100, 64])]
+        mock_session.get_outputs.return_value = [SimpleNamespace(name='output', shape=[1, 3])]
 
         inputs = mock_session.get_inputs()
         outputs = mock_session.get_outputs()
@@ -86,18 +91,15 @@ class TestModelLoading:
         assert len(inputs) == 1
         assert len(outputs) == 1
 
-    @pytest.mark.unit
     def test_model_input_shape(self):
         """Test model input shape requirements"""
         expected_input_shape = [1, 100, 64]  # (batch, time, features)
 
-        mock_input = MagicMock()
-        mock_input.shape = expected_input_shape
+        mock_input = SimpleNamespace(shape=expected_input_shape)
 
         assert mock_input.shape[0] == 1  # Batch size
         assert mock_input.shape[2] == 64  # Feature dim
 
-    @pytest.mark.unit
     def test_label_mapping(self):
         """Test label mapping"""
         label_map = {
@@ -115,7 +117,6 @@ class TestModelLoading:
 class TestResultAggregation:
     """Test aggregating results from multiple slices"""
 
-    @pytest.mark.unit
     def test_aggregate_by_voting(self):
         """Test aggregating by majority voting"""
         slice_predictions = [
@@ -134,19 +135,13 @@ class TestResultAggregation:
         winner = max(votes, key=votes.get)
         assert winner == 'normal'
 
-    @pytest.mark.unit
     def test_aggregate_by_average_score(self):
         """Test aggregating by average confidence score"""
-        slice_predictions = [
-            {'label': 'normal', 'score': 0.9},
-            {'label': 'normal', 'score': 0.85},
-            {'label': 'normal', 'score': 0.88},
-        ]
+        slice_scores = np.asarray([0.9, 0.85, 0.88], dtype=np.float32)  # all 'normal'
 
-        avg_score = sum(p['score'] for p in slice_predictions) / len(slice_predictions)
+        avg_score = float(np.mean(slice_scores))
         assert abs(avg_score - 0.877) < 0.01
 
-    @pytest.mark.unit
     def test_aggregate_with_weighted_scores(self):
         """Test aggregating with weighted scores by slice position"""
         slice_predictions = [
@@ -155,24 +150,23 @@ class TestResultAggregation:
             {'label': 'anomaly', 'score': 0.8, 'weight': 0.8},
         ]
 
-        # Calculate weighted average per label
-        label_scores = {}
+        # Calculate weighted average per label with a running [sum, count]
+        accumulator = defaultdict(lambda: [0.0, 0])
         for pred in slice_predictions:
-            label = pred['label']
-            weighted_score = pred['score'] * pred['weight']
-            if label not in label_scores:
-                label_scores[label] = []
-            label_scores[label].append(weighted_score)
+            entry = accumulator[pred['label']]
+            entry[0] += pred['score'] * pred['weight']
+            entry[1] += 1
 
         final_scores = {
-            label: sum(scores) / len(scores)
-            for label, scores in label_scores.items()
+            label: total / count
+            for label, (total, count) in accumulator.items()
         }
 
         assert 'normal' in final_scores
         assert 'anomaly' in final_scores
+        assert abs(final_scores['normal'] - 0.625) < 1e-9
+        assert abs(final_scores['anomaly'] - 0.64) < 1e-9
 
-    @pytest.mark.unit
     def test_final_result_structure(self, sample_analysis_result):
         """Test final result structure"""
         result = sample_analysis_result['results']
@@ -186,27 +180,19 @@ class TestResultAggregation:
 class TestClassifierConfidence:
     """Test classifier confidence handling"""
 
-    @pytest.mark.unit
-    def test_high_confidence_prediction(self):
-        """Test high confidence prediction"""
-        prediction = {'label': 'normal', 'score': 0.95}
-
-        threshold = 0.8
-        is_confident = prediction['score'] >= threshold
-
-        assert is_confident is True
-
-    @pytest.mark.unit
-    def test_low_confidence_prediction(self):
-        """Test low confidence prediction"""
-        prediction = {'label': 'unknown', 'score': 0.4}
-
-        threshold = 0.8
-        is_confident = prediction['score'] >= threshold
+    @pytest.mark.parametrize("label, threshold, expected", [
+        ('normal', 0.8, True),    # High confidence
+        ('anomaly', 0.8, False),  # Low confidence
+        ('normal', 0.85, True),   # Exactly at threshold
+        ('normal', 0.9, False),   # Just below threshold
+    ])
+    def test_confidence_threshold(self, sample_predictions, label, threshold, expected):
+        """Test prediction confidence against threshold"""
+        score = next(p['score'] for p in sample_predictions if p['label'] == label)
+        is_confident = score >= threshold
 
-        assert is_confident is False
+        assert is_confident is expected
 
-    @pytest.mark.unit
     def test_flag_uncertain_predictions(self):
         """Test flagging uncertain predictions"""
         predictions = [
@@ -8,8 +8,7 @@ Tests cover:
 - Result generation
 """
 import pytest
-from datetime import datetime, timezone
-from unittest.mock import MagicMock, patch
+from datetime import datetime
 
 
 class TestPipelineExecution:
@@ -50,19 +49,20 @@ class TestConfigurationApplication:
     """Test configuration application in pipeline"""
 
     @pytest.mark.unit
-    def test_apply_classification_config(self, sample_analysis_config):
-        """Test applying classification configuration"""
-        params = sample_analysis_config['parameters']
-
-        assert 'slice_duration' in params
-        assert 'sample_rate' in params
+    @pytest.mark.parametrize("section, key", [
+        ('parameters', 'slice_duration'),   # Step 1 slicer needs duration
+        ('parameters', 'sample_rate'),
+        ('model_files', 'classification_method'),
+    ])
+    def test_config_contains_key(self, sample_analysis_config, section, key):
+        """Test configuration exposes the keys the pipeline applies"""
+        assert key in sample_analysis_config[section]
 
     @pytest.mark.unit
     def test_config_model_files(self, sample_analysis_config):
         """Test accessing model files from config"""
         model_files = sample_analysis_config['model_files']
 
-        assert 'classification_method' in model_files
         assert model_files['classification_method'] == 'onnx'
 
     @pytest.mark.unit
@@ -82,20 +82,10 @@ class TestStepExecution:
     """Test individual step execution"""
 
     @pytest.mark.unit
-    def test_step0_converter_input(self, sample_recording_for_analysis):
+    @pytest.mark.parametrize("field", ['file_id', 'sample_rate', 'channels'])
+    def test_step0_converter_input(self, sample_recording_for_analysis, field):
         """Test Step 0 converter input requirements"""
-        required_fields = ['file_id', 'sample_rate', 'channels']
-
-        for field in required_fields:
-            assert field in sample_recording_for_analysis
-
-    @pytest.mark.unit
-    def test_step1_slicer_params(self, sample_analysis_config):
-        """Test Step 1 slicer parameters"""
-        params = sample_analysis_config['parameters']
-
-        # Slicer needs duration and overlap
-        assert 'slice_duration' in params
+        assert field in sample_recording_for_analysis
 
     @pytest.mark.unit
     def test_step2_leaf_feature_extraction(self):
@@ -138,7 +128,7 @@ class TestErrorHandling:
         assert config is None
 
     @pytest.mark.unit
-    def test_task_failure_logging(self, task_logs_collection):
+    def test_task_failure_logging(self, task_logs_collection, fixed_now: datetime):
         """Test logging task failure"""
         task_logs_collection.insert_one({
             'task_id': 'failed-task',
@@ -151,7 +141,7 @@ class TestErrorHandling:
                 '$set': {
                     'status': 'failed',
                     'error_message': 'Model file not found',
-                    'failed_at': datetime.now(timezone.utc),
+                    'failed_at': fixed_now,
                 }
             }
         )
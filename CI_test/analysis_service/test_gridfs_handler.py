@@ -7,8 +7,6 @@ Tests cover:
 - Metadata handling
 """
 import pytest
-from datetime import datetime, timezone
-from unittest.mock import MagicMock, patch
 
 
 class TestFileRetrieval:
@@ -39,16 +37,9 @@ class TestFileRetrieval:
 
         gfs_file = mock_gridfs_handler.get(file_id)
 
-        # Read in chunks
-        chunk_size = 1024
-        chunks = []
-        while True:
-            chunk = gfs_file.read(chunk_size)
-            if not chunk:
-                break
-            chunks.append(chunk)
-
-        full_content = b''.join(chunks)
+        # Read in chunks until read() returns b''
+        chunk_size = 512
+        full_content = b''.join(iter(lambda: gfs_file.read(chunk_size), b''))
         assert full_content == sample_wav_content
 
     @pytest.mark.unit
@@ -69,52 +60,29 @@ class TestFileStorage:
     """Test file storage to GridFS"""
 
     @pytest.mark.unit
-    def test_store_analysis_result(self, mock_gridfs_handler):
-        """Test storing analysis result file"""
-        result_data = b'{"classification": "normal", "confidence": 0.95}'
-
-        file_id = mock_gridfs_handler.put(
-            result_data,
-            filename='result_001.json',
-            metadata={
-                'type': 'analysis_result',
-                'recording_id': 'rec-001',
-            }
-        )
-
-        assert file_id is not None
-
-    @pytest.mark.unit
-    def test_store_processed_audio(self, mock_gridfs_handler, sample_wav_content):
-        """Test storing processed audio file"""
-        file_id = mock_gridfs_handler.put(
-            sample_wav_content,
-            filename='processed_audio.wav',
-            metadata={
-                'type': 'processed_audio',
-                'original_file': 'original.wav',
-                'processing_step': 'step1_slicer',
-            }
-        )
-
-        assert file_id is not None
-
-    @pytest.mark.unit
-    def test_store_feature_file(self, mock_gridfs_handler):
-        """Test storing feature extraction output"""
-        import struct
-        # Mock numpy array as bytes
-        feature_data = struct.pack('f' * 100, *[0.0] * 100)
-
-        file_id = mock_gridfs_handler.put(
-            feature_data,
-            filename='features_001.npy',
-            metadata={
-                'type': 'features',
-                'feature_type': 'leaf',
-                'shape': [10, 10],
-            }
-        )
+    @pytest.mark.parametrize('data, filename, metadata', [
+        pytest.param(
+            b'{"classification": "normal", "confidence": 0.95}',
+            'result_001.json',
+            {'type': 'analysis_result', 'recording_id': 'rec-001'},
+            id='analysis_result',
+        ),
+        pytest.param(
+            b'RIFF',
+            'processed_audio.wav',
+            {'type': 'processed_audio', 'original_file': 'original.wav', 'processing_step': 'step1_slicer'},
+            id='processed_audio',
+        ),
+        pytest.param(
+            bytes(16),  # four float32 zeros
+            'features_001.npy',
+            {'type': 'features', 'feature_type': 'leaf', 'shape': [2, 2]},
+            id='features',
+        ),
+    ])
+    def test_store_file(self, mock_gridfs_handler, data, filename, metadata):
+        """Test storing analysis outputs of each type"""
+        file_id = mock_gridfs_handler.put(data, filename=filename, metadata=metadata)
 
         assert file_id is not None
 
@@ -182,12 +150,14 @@ class TestFileOperations:
     @pytest.mark.unit
     def test_list_files(self, mock_gridfs_handler, sample_wav_content):
         """Test listing files"""
-        mock_gridfs_handler.put(sample_wav_content, filename='file1.wav')
-        mock_gridfs_handler.put(sample_wav_content, filename='file2.wav')
-        mock_gridfs_handler.put(sample_wav_content, filename='file3.wav')
+        file_ids = mock_gridfs_handler.put_many(
+            [sample_wav_content] * 3,
+            ['file1.wav', 'file2.wav', 'file3.wav']
+        )
 
         files = mock_gridfs_handler.list()
         assert len(files) >= 3
+        assert set(file_ids) <= set(files)
 
     @pytest.mark.unit
     def test_find_files_by_filter(self, mock_gridfs_handler, sample_wav_content):
@@ -9,8 +9,10 @@ Tests cover:
 """
 import pytest
 import os
-from datetime import datetime, timezone
-from unittest.mock import MagicMock, patch
+from pathlib import Path
+
+# temp_model_dir is module-scoped; start every test from an empty directory
+pytestmark = pytest.mark.usefixtures('_clean_model_dir')
 
 
 class TestModelCaching:
@@ -71,23 +73,16 @@ class TestModelDownloading:
         model_content = b'mock model binary'
         destination = os.path.join(temp_model_dir, 'classifier.onnx')
 
-        with open(destination, 'wb') as f:
-            f.write(model_content)
+        Path(destination).write_bytes(model_content)
 
         assert os.path.exists(destination)
 
     @pytest.mark.unit
-    def test_model_file_validation(self, temp_model_dir):
+    def test_model_file_validation(self, prewritten_model_file):
         """Test validating downloaded model file"""
-        model_path = os.path.join(temp_model_dir, 'model.onnx')
-
-        # Create mock model file
-        with open(model_path, 'wb') as f:
-            f.write(b'ONNX model content')
-
         # Validate file exists and has content
-        assert os.path.exists(model_path)
-        assert os.path.getsize(model_path) > 0
+        assert os.path.exists(prewritten_model_file)
+        assert os.path.getsize(prewritten_model_file) > 0
 
 
 class TestVersionManagement:
@@ -151,8 +146,7 @@ class TestCacheCleanup:
         """Test removing old cached models"""
         old_model = os.path.join(temp_model_dir, 'old_model.onnx')
 
-        with open(old_model, 'wb') as f:
-            f.write(b'old model')
+        Path(old_model).write_bytes(b'old model')
 
         assert os.path.exists(old_model)
 
@@ -165,16 +159,10 @@ class TestCacheCleanup:
         """Test cache size limit management"""
         # Create multiple model files
         for i in range(5):
-            model_path = os.path.join(temp_model_dir, f'model_{i}.onnx')
-            with open(model_path, 'wb') as f:
-                f.write(b'x' * 1000)
-
-        # Calculate total size
-        total_size = sum(
-            os.path.getsize(os.path.join(temp_model_dir, f))
-            for f in os.listdir(temp_model_dir)
-            if os.path.isfile(os.path.join(temp_model_dir, f))
-        )
+            Path(temp_model_dir, f'model_{i}.onnx').write_bytes(b'x' * 1000)
+
+        # Calculate total size; _clean_model_dir leaves only this test's files
+        total_size = sum(entry.stat().st_size for entry in os.scandir(temp_model_dir))
 
         assert total_size == 5000  # 5 files * 1000 bytes
 
@@ -183,9 +171,7 @@ class TestCacheCleanup:
         """Test cleaning up unused models"""
         # Create some model files
         for name in ['used.onnx', 'unused1.onnx', 'unused2.onnx']:
-            path = os.path.join(temp_model_dir, name)
-            with open(path, 'wb') as f:
-                f.write(b'model content')
+            Path(temp_model_dir, name).write_bytes(b'model content')
 
         # Mark 'used.onnx' as in use
         mock_model_cache.get_model('used', 'model')
@@ -8,15 +8,21 @@ Tests cover:
 - Node lifecycle
 """
 import pytest
-from datetime import datetime, timezone, timedelta
+from datetime import timedelta
 from unittest.mock import MagicMock, patch
+from pymongo import InsertOne, UpdateOne
+
+THIRTY_SEC = timedelta(seconds=30)
+ONE_MIN = timedelta(minutes=1)
+FIVE_MIN = timedelta(minutes=5)
+ONE_HOUR = timedelta(hours=1)
 
 
 class TestNodeRegistration:
     """Test node registration functionality"""
 
     @pytest.mark.unit
-    def test_register_new_node(self, node_status_collection, mock_node_manager):
+    def test_register_new_node(self, node_status_collection, mock_node_manager, fixed_now):
         """Test registering a new analysis node"""
         node_data = {
             'node_id': mock_node_manager.node_id,
@@ -24,8 +30,8 @@ class TestNodeRegistration:
             'status': 'active',
             'current_tasks': 0,
             'max_tasks': 4,
-            'last_heartbeat': datetime.now(timezone.utc),
-            'registered_at': datetime.now(timezone.utc),
+            'last_heartbeat': fixed_now,
+            'registered_at': fixed_now,
         }
 
         node_status_collection.insert_one(node_data)
@@ -50,25 +56,25 @@ class TestNodeRegistration:
         assert len(node['capabilities']) == 3
 
     @pytest.mark.unit
-    def test_update_node_on_reconnect(self, node_status_collection, mock_node_manager):
+    def test_update_node_on_reconnect(self, node_status_collection, mock_node_manager, fixed_now):
         """Test updating node on reconnection"""
-        # Insert existing node (from previous run)
-        node_status_collection.insert_one({
-            'node_id': mock_node_manager.node_id,
-            'status': 'inactive',
-            'last_heartbeat': datetime.now(timezone.utc) - timedelta(hours=1),
-        })
-
-        # Simulate reconnection
-        node_status_collection.update_one(
-            {'node_id': mock_node_manager.node_id},
-            {
-                '$set': {
-                    'status': 'active',
-                    'last_heartbeat': datetime.now(timezone.utc),
+        # Existing node from a previous run, then the reconnection update
+        node_status_collection.bulk_write([
+            InsertOne({
+                'node_id': mock_node_manager.node_id,
+                'status': 'inactive',
+                'last_heartbeat': fixed_now - ONE_HOUR,
+            }),
+            UpdateOne(
+                {'node_id': mock_node_manager.node_id},
+                {
+                    '$set': {
+                        'status': 'active',
+                        'last_heartbeat': fixed_now,
+                    }
                 }
-            }
-        )
+            ),
+        ], ordered=True)
 
         node = node_status_collection.find_one({'node_id': mock_node_manager.node_id})
         assert node['status'] == 'active'
@@ -78,67 +84,68 @@ class TestHeartbeatUpdates:
     """Test heartbeat update functionality"""
 
     @pytest.mark.unit
-    def test_update_heartbeat(self, node_status_collection, mock_node_manager):
+    def test_update_heartbeat(self, node_status_collection, mock_node_manager, fixed_now):
         """Test updating node heartbeat"""
-        node_status_collection.insert_one({
-            'node_id': mock_node_manager.node_id,
-            'status': 'active',
-            'last_heartbeat': datetime.now(timezone.utc) - timedelta(seconds=30),
-        })
-
-        new_heartbeat = datetime.now(timezone.utc)
-        node_status_collection.update_one(
-            {'node_id': mock_node_manager.node_id},
-            {'$set': {'last_heartbeat': new_heartbeat}}
-        )
+        new_heartbeat = fixed_now
+        node_status_collection.bulk_write([
+            InsertOne({
+                'node_id': mock_node_manager.node_id,
+                'status': 'active',
+                'last_heartbeat': new_heartbeat - THIRTY_SEC,
+            }),
+            UpdateOne(
+                {'node_id': mock_node_manager.node_id},
+                {'$set': {'last_heartbeat': new_heartbeat}}
+            ),
+        ], ordered=True)
 
         node = node_status_collection.find_one({'node_id': mock_node_manager.node_id})
         assert (new_heartbeat - node['last_heartbeat']).total_seconds() < 1
 
     @pytest.mark.unit
-    def test_heartbeat_with_status_update(self, node_status_collection, mock_node_manager):
+    def test_heartbeat_with_status_update(self, node_status_collection, mock_node_manager, fixed_now):
         """Test heartbeat with additional status info"""
-        node_status_collection.insert_one({
-            'node_id': mock_node_manager.node_id,
-            'status': 'active',
-            'current_tasks': 0,
-        })
-
-        node_status_collection.update_one(
-            {'node_id': mock_node_manager.node_id},
-            {
-                '$set': {
-                    'last_heartbeat': datetime.now(timezone.utc),
-                    'current_tasks': 2,
-                    'memory_usage_mb': 512,
-                    'cpu_usage_percent': 45.5,
+        node_status_collection.bulk_write([
+            InsertOne({
+                'node_id': mock_node_manager.node_id,
+                'status': 'active',
+                'current_tasks': 0,
+            }),
+            UpdateOne(
+                {'node_id': mock_node_manager.node_id},
+                {
+                    '$set': {
+                        'last_heartbeat': fixed_now,
+                        'current_tasks': 2,
+                        'memory_usage_mb': 512,
+                        'cpu_usage_percent': 45.5,
+                    }
                 }
-            }
-        )
+            ),
+        ], ordered=True)
 
         node = node_status_collection.find_one({'node_id': mock_node_manager.node_id})
         assert node['current_tasks'] == 2
         assert 'memory_usage_mb' in node
 
     @pytest.mark.unit
-    def test_detect_stale_heartbeat(self, node_status_collection):
+    def test_detect_stale_heartbeat(self, node_status_collection, fixed_now):
         """Test detecting stale heartbeat"""
-        now = datetime.now(timezone.utc)
-        threshold = now - timedelta(minutes=1)
+        threshold = fixed_now - ONE_MIN
 
         node_status_collection.insert_one({
             'node_id': 'stale-node',
             'status': 'active',
-            'last_heartbeat': now - timedelta(minutes=5),
+            'last_heartbeat': fixed_now - FIVE_MIN,
         })
 
-        stale_nodes = list(node_status_collection.find({
-            'status': 'active',
-            'last_heartbeat': {'$lt': threshold}
-        }))
+        # Only node_id is read, so project everything else away
+        stale_nodes = list(node_status_collection.find(
+            {'status': 'active', 'last_heartbeat': {'$lt': threshold}},
+            {'node_id': 1, '_id': 0},
+        ))
 
-        assert len(stale_nodes) == 1
-        assert stale_nodes[0]['node_id'] == 'stale-node'
+        assert stale_nodes == [{'node_id': 'stale-node'}]
 
 
 class TestTaskCounting:
@@ -147,16 +154,14 @@ class TestTaskCounting:
     @pytest.mark.unit
     def test_increment_task_count(self, node_status_collection, mock_node_manager):
         """Test incrementing current task count"""
-        node_status_collection.insert_one({
-            'node_id': mock_node_manager.node_id,
-            'current_tasks': 0,
-            'max_tasks': 4,
-        })
-
-        node_status_collection.update_one(
-            {'node_id': mock_node_manager.node_id},
-            {'$inc': {'current_tasks': 1}}
-        )
+        node_status_collection.bulk_write([
+            InsertOne({
+                'node_id': mock_node_manager.node_id,
+                'current_tasks': 0,
+                'max_tasks': 4,
+            }),
+            UpdateOne({'node_id': mock_node_manager.node_id}, {'$inc': {'current_tasks': 1}}),
+        ], ordered=True)
 
         node = node_status_collection.find_one({'node_id': mock_node_manager.node_id})
         assert node['current_tasks'] == 1
@@ -164,16 +169,14 @@ class TestTaskCounting:
     @pytest.mark.unit
     def test_decrement_task_count(self, node_status_collection, mock_node_manager):
         """Test decrementing current task count"""
-        node_status_collection.insert_one({
-            'node_id': mock_node_manager.node_id,
-            'current_tasks': 3,
-            'max_tasks': 4,
-        })
-
-        node_status_collection.update_one(
-            {'node_id': mock_node_manager.node_id},
-            {'$inc': {'current_tasks': -1}}
-        )
+        node_status_collection.bulk_write([
+            InsertOne({
+                'node_id': mock_node_manager.node_id,
+                'current_tasks': 3,
+                'max_tasks': 4,
+            }),
+            UpdateOne({'node_id': mock_node_manager.node_id}, {'$inc': {'current_tasks': -1}}),
+        ], ordered=True)
 
         node = node_status_collection.find_one({'node_id': mock_node_manager.node_id})
         assert node['current_tasks'] == 2
@@ -228,7 +231,7 @@ class TestNodeLifecycle:
         assert node is None
 
     @pytest.mark.unit
-    def test_mark_node_inactive(self, node_status_collection, mock_node_manager):
+    def test_mark_node_inactive(self, node_status_collection, mock_node_manager, fixed_now):
         """Test marking node as inactive (graceful shutdown)"""
         node_status_collection.insert_one({
             'node_id': mock_node_manager.node_id,
@@ -237,7 +240,7 @@ class TestNodeLifecycle:
 
         node_status_collection.update_one(
             {'node_id': mock_node_manager.node_id},
-            {'$set': {'status': 'inactive', 'shutdown_at': datetime.now(timezone.utc)}}
+            {'$set': {'status': 'inactive', 'shutdown_at': fixed_now}}
         )
 
         node = node_status_collection.find_one({'node_id': mock_node_manager.node_id})
@@ -246,9 +249,11 @@ class TestNodeLifecycle:
     @pytest.mark.unit
     def test_get_active_nodes(self, node_status_collection):
         """Test getting all active nodes"""
-        node_status_collection.insert_one({'node_id': 'active-1', 'status': 'active'})
-        node_status_collection.insert_one({'node_id': 'active-2', 'status': 'active'})
-        node_status_collection.insert_one({'node_id': 'inactive-1', 'status': 'inactive'})
+        node_status_collection.insert_many([
+            {'node_id': 'active-1', 'status': 'active'},
+            {'node_id': 'active-2', 'status': 'active'},
+            {'node_id': 'inactive-1', 'status': 'inactive'},
+        ])
 
         active_nodes = list(node_status_collection.find({'status': 'active'}))
 
@@ -257,21 +262,23 @@ class TestNodeLifecycle:
     @pytest.mark.unit
     def test_get_nodes_by_capability(self, node_status_collection):
         """Test getting nodes by capability"""
-        node_status_collection.insert_one({
-            'node_id': 'classifier',
-            'capabilities': ['audio_classification'],
-            'status': 'active',
-        })
-        node_status_collection.insert_one({
-            'node_id': 'detector',
-            'capabilities': ['anomaly_detection'],
-            'status': 'active',
-        })
-        node_status_collection.insert_one({
-            'node_id': 'multi',
-            'capabilities': ['audio_classification', 'anomaly_detection'],
-            'status': 'active',
-        })
+        node_status_collection.insert_many([
+            {
+                'node_id': 'classifier',
+                'capabilities': ['audio_classification'],
+                'status': 'active',
+            },
+            {
+                'node_id': 'detector',
+                'capabilities': ['anomaly_detection'],
+                'status': 'active',
+            },
+            {
+                'node_id': 'multi',
+                'capabilities': ['audio_classification', 'anomaly_detection'],
+                'status': 'active',
+            },
+        ])
 
         classification_nodes = list(node_status_collection.find({
             'status': 'active',
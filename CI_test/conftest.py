@@ -3,6 +3,7 @@ Root conftest.py - Shared fixtures for all test modules
 """
 import os
 import sys
+import copy
 import json
 import tempfile
 import shutil
@@ -12,16 +13,21 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-# Add project root to path
+# Add project paths (later entries take precedence; skip ones already present)
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, PROJECT_ROOT)
-sys.path.insert(0, os.path.join(PROJECT_ROOT, 'core', 'state_management'))
-sys.path.insert(0, os.path.join(PROJECT_ROOT, 'sub_system', 'edge_client'))
-sys.path.insert(0, os.path.join(PROJECT_ROOT, 'sub_system', 'analysis_service'))
+for _path in (
+    PROJECT_ROOT,
+    os.path.join(PROJECT_ROOT, 'core', 'state_management'),
+    os.path.join(PROJECT_ROOT, 'sub_system', 'edge_client'),
+    os.path.join(PROJECT_ROOT, 'sub_system', 'analysis_service'),
+):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
 
 # Import mocks after path setup
 from CI_test.mocks.mock_mongodb import MockMongoClient, MockDatabase, MockCollection, MockGridFS
 from CI_test.mocks.mock_rabbitmq import MockChannel, MockConnection
+from CI_test.mocks.wav import write_silent_wav
 
 # Register fixture plugins for pytest to discover
 pytest_plugins = [
@@ -122,19 +128,25 @@ def mock_env_vars(state_management_env_vars: Dict[str, str]):
 # Temporary Directory Fixtures
 # ============================================================================
 
+@pytest.fixture(scope="session")
+def _temp_root() -> Generator[str, None, None]:
+    """Session-wide parent of every temp_dir, removed in one pass at the end"""
+    root = tempfile.mkdtemp(prefix='ci_test_')
+    yield root
+    shutil.rmtree(root, ignore_errors=True)
+
+
 @pytest.fixture
-def temp_dir() -> Generator[str, None, None]:
-    """Create a temporary directory for tests"""
-    dir_path = tempfile.mkdtemp(prefix='ci_test_')
-    yield dir_path
-    shutil.rmtree(dir_path, ignore_errors=True)
+def temp_dir(_temp_root: str) -> str:
+    """Create a fresh, empty temporary directory for a test"""
+    return tempfile.mkdtemp(dir=_temp_root)
 
 
 @pytest.fixture
 def temp_wav_dir(temp_dir: str) -> str:
     """Create a temporary WAV directory"""
     wav_dir = os.path.join(temp_dir, 'temp_wav')
-    os.makedirs(wav_dir, exist_ok=True)
+    os.mkdir(wav_dir)
     return wav_dir
 
 
@@ -142,7 +154,7 @@ def temp_wav_dir(temp_dir: str) -> str:
 def temp_log_dir(temp_dir: str) -> str:
     """Create a temporary log directory"""
     log_dir = os.path.join(temp_dir, 'logs')
-    os.makedirs(log_dir, exist_ok=True)
+    os.mkdir(log_dir)
     return log_dir
 
 
@@ -150,7 +162,7 @@ def temp_log_dir(temp_dir: str) -> str:
 def temp_model_dir(temp_dir: str) -> str:
     """Create a temporary model cache directory"""
     model_dir = os.path.join(temp_dir, 'models')
-    os.makedirs(model_dir, exist_ok=True)
+    os.mkdir(model_dir)
     return model_dir
 
 
@@ -158,7 +170,7 @@ def temp_model_dir(temp_dir: str) -> str:
 def temp_upload_dir(temp_dir: str) -> str:
     """Create a temporary upload directory"""
     upload_dir = os.path.join(temp_dir, 'uploads')
-    os.makedirs(upload_dir, exist_ok=True)
+    os.mkdir(upload_dir)
     return upload_dir
 
 
@@ -166,9 +178,9 @@ def temp_upload_dir(temp_dir: str) -> str:
 # MongoDB Mock Fixtures
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_mongo_client() -> MockMongoClient:
-    """Create a mock MongoDB client"""
+    """Create a mock MongoDB client (emptied after each test by _reset_mocks)"""
     return MockMongoClient()
 
 
@@ -184,9 +196,9 @@ def mock_collection(mock_database: MockDatabase) -> MockCollection:
     return mock_database['test_collection']
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_gridfs() -> MockGridFS:
-    """Create a mock GridFS instance"""
+    """Create a mock GridFS instance (emptied after each test by _reset_mocks)"""
     return MockGridFS()
 
 
@@ -201,18 +213,39 @@ def patched_mongodb(mock_mongo_client: MockMongoClient):
 # RabbitMQ Mock Fixtures
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_rabbitmq_channel() -> MockChannel:
-    """Create a mock RabbitMQ channel"""
+    """Create a mock RabbitMQ channel (reset after each test by _reset_mocks)"""
     return MockChannel()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_rabbitmq_connection(mock_rabbitmq_channel: MockChannel) -> MockConnection:
-    """Create a mock RabbitMQ connection"""
+    """Create a mock RabbitMQ connection (reset after each test by _reset_mocks)"""
     return MockConnection(mock_rabbitmq_channel)
 
 
+@pytest.fixture(autouse=True)
+def _reset_mocks(request: pytest.FixtureRequest) -> Generator[None, None, None]:
+    """
+    Clear the session-scoped Mongo/GridFS/RabbitMQ mocks between tests
+
+    Only mocks in the test's fixture closure are touched, so tests that never
+    use them (e.g. the edge suite) don't instantiate or reset them.
+    """
+    yield
+    used = request.fixturenames
+    if 'mock_mongo_client' in used:
+        request.getfixturevalue('mock_mongo_client')._reset()
+    if 'mock_gridfs' in used:
+        request.getfixturevalue('mock_gridfs')._reset()
+    # Resetting the connection also resets its primary channel
+    if 'mock_rabbitmq_connection' in used:
+        request.getfixturevalue('mock_rabbitmq_connection')._reset()
+    elif 'mock_rabbitmq_channel' in used:
+        request.getfixturevalue('mock_rabbitmq_channel')._reset()
+
+
 @pytest.fixture
 def patched_rabbitmq(mock_rabbitmq_connection: MockConnection):
     """Patch pika.BlockingConnection with mock"""
@@ -225,169 +258,198 @@ def patched_rabbitmq(mock_rabbitmq_connection: MockConnection):
 # ============================================================================
 
 @pytest.fixture
-def sample_user_data() -> Dict[str, Any]:
+def frozen_now() -> datetime:
+    """Single UTC timestamp shared by every sample fixture in a test"""
+    return datetime.now(timezone.utc)
+
+
+_SAMPLE_USER_DATA = {
+    'username': 'test_user',
+    'email': 'test@example.com',
+    'password_hash': 'hashed_password_123',
+    'role': 'user',
+    'is_active': True,
+}
+
+_SAMPLE_ADMIN_USER_DATA = {
+    'username': 'admin_user',
+    'email': 'admin@example.com',
+    'password_hash': 'hashed_admin_password',
+    'role': 'admin',
+    'is_active': True,
+}
+
+_SAMPLE_ANALYSIS_CONFIG = {
+    'config_id': 'config-001',
+    'config_name': 'Test Audio Classification',
+    'analysis_method_id': 'audio_classification',
+    'description': 'Test configuration for audio classification',
+    'parameters': {
+        'slice_duration': 10.0,
+        'overlap': 0.5,
+        'sample_rate': 16000,
+    },
+    'model_files': {
+        'classification_method': 'onnx',
+        'onnx_model': {
+            'file_id': 'model-file-001',
+            'filename': 'classifier.onnx',
+            'version': '1.0.0',
+        },
+    },
+    'enabled': True,
+    'is_system': False,
+}
+
+_SAMPLE_ROUTING_RULE = {
+    'rule_id': 'rule-001',
+    'rule_name': 'Test Routing Rule',
+    'description': 'Route audio files to analysis',
+    'conditions': {
+        'device_id': {'$regex': 'device-.*'},
+        'file_type': 'wav',
+    },
+    'target_config_id': 'config-001',
+    'target_mongodb_instance': 'default',
+    'priority': 100,
+    'enabled': True,
+}
+
+_SAMPLE_MONGODB_INSTANCE = {
+    'instance_id': 'test-instance-001',
+    'instance_name': 'Test MongoDB Instance',
+    'description': 'Test instance for CI',
+    'host': 'localhost',
+    'port': 27017,
+    'username': 'test_user',
+    'password': 'test_password',
+    'database': 'test_db',
+    'collection': 'recordings',
+    'auth_source': 'admin',
+    'enabled': True,
+    'is_system': False,
+}
+
+_SAMPLE_EDGE_DEVICE = {
+    'device_id': 'edge-device-001',
+    'device_name': 'Test Edge Device',
+    'platform': 'win32',
+    'status': 'online',
+    'audio_config': {
+        'default_device_index': 0,
+        'channels': 1,
+        'sample_rate': 16000,
+        'bit_depth': 16,
+    },
+}
+
+_SAMPLE_RECORDING_DOCUMENT = {
+    '_id': 'rec-001',
+    'recording_uuid': 'uuid-001-002-003',
+    'device_id': 'edge-device-001',
+    'device_name': 'Test Edge Device',
+    'filename': 'recording_20260114_120000.wav',
+    'original_filename': 'recording.wav',
+    'file_size': 320000,
+    'duration': 10.0,
+    'sample_rate': 16000,
+    'channels': 1,
+    'bit_depth': 16,
+    'upload_status': 'completed',
+    'analysis_status': 'pending',
+}
+
+_SAMPLE_TASK_DATA = {
+    'task_id': 'task-001',
+    'recording_id': 'rec-001',
+    'analyze_uuid': 'uuid-001-002-003',
+    'config_id': 'config-001',
+    'analysis_method_id': 'audio_classification',
+    'mongodb_instance': 'default',
+    'priority': 5,
+}
+
+_SAMPLE_NODE_STATUS = {
+    'node_id': 'test-node-001',
+    'capabilities': ['audio_classification', 'anomaly_detection'],
+    'status': 'active',
+    'current_tasks': 0,
+    'max_tasks': 4,
+}
+
+
+@pytest.fixture
+def sample_user_data(frozen_now: datetime) -> Dict[str, Any]:
     """Sample user data"""
-    return {
-        'username': 'test_user',
-        'email': 'test@example.com',
-        'password_hash': 'hashed_password_123',
-        'role': 'user',
-        'is_active': True,
-        'created_at': datetime.now(timezone.utc),
-        'updated_at': datetime.now(timezone.utc),
-    }
+    return {**_SAMPLE_USER_DATA, 'created_at': frozen_now, 'updated_at': frozen_now}
 
 
 @pytest.fixture
-def sample_admin_user_data() -> Dict[str, Any]:
+def sample_admin_user_data(frozen_now: datetime) -> Dict[str, Any]:
     """Sample admin user data"""
-    return {
-        'username': 'admin_user',
-        'email': 'admin@example.com',
-        'password_hash': 'hashed_admin_password',
-        'role': 'admin',
-        'is_active': True,
-        'created_at': datetime.now(timezone.utc),
-        'updated_at': datetime.now(timezone.utc),
-    }
+    return {**_SAMPLE_ADMIN_USER_DATA, 'created_at': frozen_now, 'updated_at': frozen_now}
 
 
 @pytest.fixture
-def sample_analysis_config() -> Dict[str, Any]:
+def sample_analysis_config(frozen_now: datetime) -> Dict[str, Any]:
     """Sample analysis configuration"""
     return {
-        'config_id': 'config-001',
-        'config_name': 'Test Audio Classification',
-        'analysis_method_id': 'audio_classification',
-        'description': 'Test configuration for audio classification',
-        'parameters': {
-            'slice_duration': 10.0,
-            'overlap': 0.5,
-            'sample_rate': 16000,
-        },
-        'model_files': {
-            'classification_method': 'onnx',
-            'onnx_model': {
-                'file_id': 'model-file-001',
-                'filename': 'classifier.onnx',
-                'version': '1.0.0',
-            },
-        },
-        'enabled': True,
-        'is_system': False,
-        'created_at': datetime.now(timezone.utc),
-        'updated_at': datetime.now(timezone.utc),
+        **_SAMPLE_ANALYSIS_CONFIG,
+        'parameters': dict(_SAMPLE_ANALYSIS_CONFIG['parameters']),
+        'model_files': copy.deepcopy(_SAMPLE_ANALYSIS_CONFIG['model_files']),
+        'created_at': frozen_now,
+        'updated_at': frozen_now,
     }
 
 
 @pytest.fixture
-def sample_routing_rule() -> Dict[str, Any]:
+def sample_routing_rule(frozen_now: datetime) -> Dict[str, Any]:
     """Sample routing rule"""
     return {
-        'rule_id': 'rule-001',
-        'rule_name': 'Test Routing Rule',
-        'description': 'Route audio files to analysis',
-        'conditions': {
-            'device_id': {'$regex': 'device-.*'},
-            'file_type': 'wav',
-        },
-        'target_config_id': 'config-001',
-        'target_mongodb_instance': 'default',
-        'priority': 100,
-        'enabled': True,
-        'created_at': datetime.now(timezone.utc),
-        'updated_at': datetime.now(timezone.utc),
+        **_SAMPLE_ROUTING_RULE,
+        'conditions': copy.deepcopy(_SAMPLE_ROUTING_RULE['conditions']),
+        'created_at': frozen_now,
+        'updated_at': frozen_now,
     }
 
 
 @pytest.fixture
-def sample_mongodb_instance() -> Dict[str, Any]:
+def sample_mongodb_instance(frozen_now: datetime) -> Dict[str, Any]:
     """Sample MongoDB instance configuration"""
-    return {
-        'instance_id': 'test-instance-001',
-        'instance_name': 'Test MongoDB Instance',
-        'description': 'Test instance for CI',
-        'host': 'localhost',
-        'port': 27017,
-        'username': 'test_user',
-        'password': 'test_password',
-        'database': 'test_db',
-        'collection': 'recordings',
-        'auth_source': 'admin',
-        'enabled': True,
-        'is_system': False,
-        'created_at': datetime.now(timezone.utc),
-        'updated_at': datetime.now(timezone.utc),
-    }
+    return {**_SAMPLE_MONGODB_INSTANCE, 'created_at': frozen_now, 'updated_at': frozen_now}
 
 
 @pytest.fixture
-def sample_edge_device() -> Dict[str, Any]:
+def sample_edge_device(frozen_now: datetime) -> Dict[str, Any]:
     """Sample edge device data"""
     return {
-        'device_id': 'edge-device-001',
-        'device_name': 'Test Edge Device',
-        'platform': 'win32',
-        'status': 'online',
-        'last_heartbeat': datetime.now(timezone.utc),
-        'audio_config': {
-            'default_device_index': 0,
-            'channels': 1,
-            'sample_rate': 16000,
-            'bit_depth': 16,
-        },
-        'registered_at': datetime.now(timezone.utc),
+        **_SAMPLE_EDGE_DEVICE,
+        'audio_config': dict(_SAMPLE_EDGE_DEVICE['audio_config']),
+        'last_heartbeat': frozen_now,
+        'registered_at': frozen_now,
     }
 
 
 @pytest.fixture
-def sample_recording_document() -> Dict[str, Any]:
+def sample_recording_document(frozen_now: datetime) -> Dict[str, Any]:
     """Sample recording document"""
-    return {
-        '_id': 'rec-001',
-        'recording_uuid': 'uuid-001-002-003',
-        'device_id': 'edge-device-001',
-        'device_name': 'Test Edge Device',
-        'filename': 'recording_20260114_120000.wav',
-        'original_filename': 'recording.wav',
-        'file_size': 320000,
-        'duration': 10.0,
-        'sample_rate': 16000,
-        'channels': 1,
-        'bit_depth': 16,
-        'upload_status': 'completed',
-        'analysis_status': 'pending',
-        'created_at': datetime.now(timezone.utc),
-        'updated_at': datetime.now(timezone.utc),
-    }
+    return {**_SAMPLE_RECORDING_DOCUMENT, 'created_at': frozen_now, 'updated_at': frozen_now}
 
 
 @pytest.fixture
-def sample_task_data() -> Dict[str, Any]:
+def sample_task_data(frozen_now: datetime) -> Dict[str, Any]:
     """Sample analysis task data"""
-    return {
-        'task_id': 'task-001',
-        'recording_id': 'rec-001',
-        'analyze_uuid': 'uuid-001-002-003',
-        'config_id': 'config-001',
-        'analysis_method_id': 'audio_classification',
-        'mongodb_instance': 'default',
-        'priority': 5,
-        'created_at': datetime.now(timezone.utc).isoformat(),
-    }
+    return {**_SAMPLE_TASK_DATA, 'created_at': frozen_now.isoformat()}
 
 
 @pytest.fixture
-def sample_node_status() -> Dict[str, Any]:
+def sample_node_status(frozen_now: datetime) -> Dict[str, Any]:
     """Sample analysis node status"""
     return {
-        'node_id': 'test-node-001',
-        'capabilities': ['audio_classification', 'anomaly_detection'],
-        'status': 'active',
-        'current_tasks': 0,
-        'max_tasks': 4,
-        'last_heartbeat': datetime.now(timezone.utc),
-        'registered_at': datetime.now(timezone.utc),
+        **_SAMPLE_NODE_STATUS,
+        'capabilities': list(_SAMPLE_NODE_STATUS['capabilities']),
+        'last_heartbeat': frozen_now,
+        'registered_at': frozen_now,
     }
 
 
@@ -428,35 +490,7 @@ def flask_app_context(flask_app):
 
 def create_sample_wav_file(filepath: str, duration_seconds: float = 1.0, sample_rate: int = 16000) -> str:
     """Create a sample WAV file for testing"""
-    import struct
-
-    num_samples = int(duration_seconds * sample_rate)
-
-    # WAV header
-    header = struct.pack(
-        '<4sI4s4sIHHIIHH4sI',
-        b'RIFF',
-        36 + num_samples * 2,  # File size - 8
-        b'WAVE',
-        b'fmt ',
-        16,  # Subchunk1 size
-        1,   # Audio format (PCM)
-        1,   # Num channels
-        sample_rate,
-        sample_rate * 2,  # Byte rate
-        2,   # Block align
-        16,  # Bits per sample
-        b'data',
-        num_samples * 2,  # Data size
-    )
-
-    # Generate silent audio (zeros)
-    audio_data = bytes(num_samples * 2)
-
-    with open(filepath, 'wb') as f:
-        f.write(header)
-        f.write(audio_data)
-
+    write_silent_wav(filepath, int(duration_seconds * sample_rate), sample_rate)
     return filepath
 
 
@@ -468,11 +502,32 @@ def sample_wav_file(temp_wav_dir: str) -> str:
 
 
 # ============================================================================
-# Markers Configuration
+# Markers / Temp Directory Configuration
 # ============================================================================
 
+def _use_tmpfs_basetemp(config) -> None:
+    """
+    On Linux CI runners, put tmp_path/tmp_path_factory on tmpfs
+
+    Fixture writes then stay in RAM instead of going through disk writeback.
+    An explicit --basetemp (including the per-worker one xdist passes down)
+    always wins, and local runs keep pytest's default location and retention.
+    Each run gets its own directory, since pytest wipes basetemp on start and
+    concurrent runs as one user would otherwise delete each other's files;
+    it is removed again when the run ends so tmpfs does not fill up.
+    """
+    if config.option.basetemp or not os.environ.get('CI') or not os.path.isdir('/dev/shm'):
+        return
+    basetemp = tempfile.mkdtemp(dir='/dev/shm', prefix='pytest-')
+    config.option.basetemp = basetemp
+    config.add_cleanup(lambda: shutil.rmtree(basetemp, ignore_errors=True))
+
+
+@pytest.hookimpl(tryfirst=True)
 def pytest_configure(config):
-    """Configure custom markers"""
+    """Configure custom markers (and the temp root, before the tmpdir plugin reads it)"""
+    _use_tmpfs_basetemp(config)
+
     config.addinivalue_line(
         "markers", "unit: Unit tests (fast, no external dependencies)"
     )
@@ -499,19 +554,27 @@ def pytest_collection_modifyitems(config, items):
     skip_slow = pytest.mark.skip(reason="Slow tests skipped by default")
     skip_windows = pytest.mark.skip(reason="Windows-only tests skipped on non-Windows")
 
+    # Options and platform are fixed for the run, so decide once which
+    # keyword -> skip pairs apply and leave the others out of the loop
+    skips = []
+    # Skip integration tests unless a -m expression was given
+    if not config.getoption("-m", default=""):
+        skips.append(("integration", skip_integration))
+    # Skip slow tests unless explicitly requested
+    if not config.getoption("--runslow", default=False):
+        skips.append(("slow", skip_slow))
+    # Skip Windows-only tests on non-Windows platforms
+    if sys.platform != "win32":
+        skips.append(("windows_only", skip_windows))
+
+    if not skips:
+        return
+
     for item in items:
-        # Skip integration tests unless explicitly requested
-        if "integration" in item.keywords and not config.getoption("-m", default=""):
-            if "integration" not in (config.getoption("-m", default="") or ""):
-                item.add_marker(skip_integration)
-
-        # Skip slow tests unless explicitly requested
-        if "slow" in item.keywords and not config.getoption("--runslow", default=False):
-            item.add_marker(skip_slow)
-
-        # Skip Windows-only tests on non-Windows platforms
-        if "windows_only" in item.keywords and sys.platform != "win32":
-            item.add_marker(skip_windows)
+        keywords = item.keywords
+        for keyword, skip in skips:
+            if keyword in keywords:
+                item.add_marker(skip)
 
 
 def pytest_addoption(parser):
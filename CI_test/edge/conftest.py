@@ -3,9 +3,10 @@ Pytest configuration and shared fixtures for edge client tests
 """
 import os
 import sys
+import copy
 import json
-import tempfile
 import shutil
+import tempfile
 from typing import Generator
 from unittest.mock import MagicMock, patch
 
@@ -18,43 +19,105 @@ sys.path.insert(0, os.path.join(PROJECT_ROOT, 'sub_system', 'edge_client'))
 
 from CI_test.edge.mocks.mock_server import MockSocketIOServer, MockSocketIOClient
 from CI_test.edge.mocks.mock_audio import MockSoundDevice, MockAudioManager
+from CI_test.edge.mocks.mock_clock import FakeClock
+
+
+@pytest.fixture(scope="module")
+def _edge_temp_root(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Module-wide parent of every temp_dir (old runs pruned by pytest's retention)"""
+    return str(tmp_path_factory.mktemp('edge_test_'))
 
 
 @pytest.fixture
-def temp_dir() -> Generator[str, None, None]:
-    """Create a temporary directory for tests"""
-    dir_path = tempfile.mkdtemp(prefix='edge_test_')
-    yield dir_path
-    shutil.rmtree(dir_path, ignore_errors=True)
+def temp_dir(_edge_temp_root: str) -> str:
+    """Create a fresh, empty temporary directory for a test"""
+    return tempfile.mkdtemp(dir=_edge_temp_root)
+
+
+# Sample payload templates, built once at import; fixtures hand out copies
+_SAMPLE_CONFIG = {
+    "device_id": "test-device-001",
+    "device_name": "Test_Device",
+    "server_url": "http://localhost:55103",
+    "audio_config": {
+        "default_device_index": 0,
+        "channels": 1,
+        "sample_rate": 16000,
+        "bit_depth": 16
+    },
+    "heartbeat_interval": 30,
+    "reconnect_delay": 5,
+    "max_reconnect_delay": 60,
+    "temp_wav_dir": "temp_wav"
+}
+
+# config_file contents, serialized once
+_SAMPLE_CONFIG_JSON = json.dumps(_SAMPLE_CONFIG).encode('utf-8')
+
+_SAMPLE_HEARTBEAT_DATA = {
+    'device_id': 'test-device-001',
+    'status': 'idle',
+    'current_recording': None,
+    'timestamp': '2026-01-14T12:00:00'
+}
+
+_SAMPLE_REGISTRATION_DATA = {
+    'device_id': 'test-device-001',
+    'device_name': 'Test_Device',
+    'platform': 'win32',
+    'audio_config': {
+        'default_device_index': 0,
+        'channels': 1,
+        'sample_rate': 16000,
+        'bit_depth': 16,
+        'available_devices': [
+            {'index': 0, 'name': 'Mock Microphone', 'max_input_channels': 2}
+        ]
+    }
+}
+
+_SAMPLE_RECORD_COMMAND = {
+    'recording_uuid': 'rec-uuid-001',
+    'duration': 10,
+    'channels': 1,
+    'sample_rate': 16000,
+    'device_index': 0,
+    'bit_depth': 16
+}
+
+_SAMPLE_RECORDING_COMPLETED_DATA = {
+    'device_id': 'test-device-001',
+    'recording_uuid': 'rec-uuid-001',
+    'filename': 'test_recording.wav',
+    'file_size': 320000,
+    'file_hash': 'abc123def456',
+    'actual_duration': 10
+}
 
 
 @pytest.fixture
 def sample_config() -> dict:
     """Sample device configuration"""
-    return {
-        "device_id": "test-device-001",
-        "device_name": "Test_Device",
-        "server_url": "http://localhost:55103",
-        "audio_config": {
-            "default_device_index": 0,
-            "channels": 1,
-            "sample_rate": 16000,
-            "bit_depth": 16
-        },
-        "heartbeat_interval": 30,
-        "reconnect_delay": 5,
-        "max_reconnect_delay": 60,
-        "temp_wav_dir": "temp_wav"
-    }
+    return copy.deepcopy(_SAMPLE_CONFIG)
+
+
+@pytest.fixture(scope="session")
+def config_file(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """
+    Config file holding sample_config, written once per session
+
+    Read-only: tests that save through ConfigManager must use
+    mutable_config_file instead.
+    """
+    config_path = tmp_path_factory.mktemp('config_') / 'device_config.json'
+    config_path.write_bytes(_SAMPLE_CONFIG_JSON)
+    return str(config_path)
 
 
 @pytest.fixture
-def config_file(temp_dir: str, sample_config: dict) -> str:
-    """Create a temporary config file"""
-    config_path = os.path.join(temp_dir, 'device_config.json')
-    with open(config_path, 'w', encoding='utf-8') as f:
-        json.dump(sample_config, f)
-    return config_path
+def mutable_config_file(config_file: str, temp_dir: str) -> str:
+    """Per-test copy of config_file that may be rewritten"""
+    return shutil.copy(config_file, os.path.join(temp_dir, 'device_config.json'))
 
 
 @pytest.fixture
@@ -73,16 +136,63 @@ def mock_socketio_client() -> MockSocketIOClient:
 
 
 @pytest.fixture
+def fake_clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """
+    Virtual clock patched over time.sleep
+
+    Polling loops advance fake_clock.now instead of sleeping; signal state
+    changes to them with a threading.Event rather than waiting for a poll.
+    """
+    clock = FakeClock()
+    monkeypatch.setattr('time.sleep', clock.sleep)
+    return clock
+
+
+@pytest.fixture(scope="session")
 def mock_sounddevice() -> MockSoundDevice:
-    """Create a mock sounddevice module"""
+    """Create a mock sounddevice module (reset after each test by _reset_sounddevice)"""
     return MockSoundDevice()
 
 
+# Autouse fixtures run for every edge test, so they (and mock_sounddevice)
+# must not depend on mock_audio_manager or other fixtures that write files;
+# tests that only need the sounddevice mock shouldn't pay for a recorder.
+@pytest.fixture(autouse=True)
+def _reset_sounddevice(mock_sounddevice: MockSoundDevice) -> Generator[None, None, None]:
+    """Restore the session-scoped sounddevice mock between tests"""
+    yield
+    mock_sounddevice._reset()
+
+
+@pytest.fixture(scope="session")
+def _session_audio_manager(tmp_path_factory: pytest.TempPathFactory) -> MockAudioManager:
+    """One MockAudioManager for the session, recording into its own temp dir"""
+    return MockAudioManager(temp_dir=str(tmp_path_factory.mktemp('temp_wav_')))
+
+
 @pytest.fixture
-def mock_audio_manager(temp_dir: str) -> Generator[MockAudioManager, None, None]:
-    """Create a mock audio manager"""
-    manager = MockAudioManager(temp_dir=os.path.join(temp_dir, 'temp_wav'))
-    yield manager
+def mock_audio_manager(_session_audio_manager: MockAudioManager) -> Generator[MockAudioManager, None, None]:
+    """Mock audio manager, reset (recordings removed) after each test"""
+    yield _session_audio_manager
+    _session_audio_manager._reset()
+
+
+@pytest.fixture(scope="module")
+def recorded_wav(tmp_path_factory: pytest.TempPathFactory) -> Generator[str, None, None]:
+    """
+    One 1 s / 16 kHz / mono mock recording shared by a module's read-only tests
+
+    Tests that change the manager's state or need other recording parameters
+    should call mock_audio_manager.record() themselves.
+    """
+    manager = MockAudioManager(temp_dir=str(tmp_path_factory.mktemp('recorded_wav_')))
+    yield manager.record(
+        duration=1,
+        sample_rate=16000,
+        channels=1,
+        device_index=0,
+        device_name='test'
+    )
     manager.cleanup()
 
 
@@ -105,57 +215,25 @@ def patched_sounddevice(mock_sounddevice: MockSoundDevice):
 @pytest.fixture
 def sample_heartbeat_data() -> dict:
     """Sample heartbeat data"""
-    return {
-        'device_id': 'test-device-001',
-        'status': 'idle',
-        'current_recording': None,
-        'timestamp': '2026-01-14T12:00:00'
-    }
+    return dict(_SAMPLE_HEARTBEAT_DATA)
 
 
 @pytest.fixture
 def sample_registration_data() -> dict:
     """Sample registration data"""
-    return {
-        'device_id': 'test-device-001',
-        'device_name': 'Test_Device',
-        'platform': 'win32',
-        'audio_config': {
-            'default_device_index': 0,
-            'channels': 1,
-            'sample_rate': 16000,
-            'bit_depth': 16,
-            'available_devices': [
-                {'index': 0, 'name': 'Mock Microphone', 'max_input_channels': 2}
-            ]
-        }
-    }
+    return copy.deepcopy(_SAMPLE_REGISTRATION_DATA)
 
 
 @pytest.fixture
 def sample_record_command() -> dict:
     """Sample record command data"""
-    return {
-        'recording_uuid': 'rec-uuid-001',
-        'duration': 10,
-        'channels': 1,
-        'sample_rate': 16000,
-        'device_index': 0,
-        'bit_depth': 16
-    }
+    return dict(_SAMPLE_RECORD_COMMAND)
 
 
 @pytest.fixture
 def sample_recording_completed_data() -> dict:
     """Sample recording completed data"""
-    return {
-        'device_id': 'test-device-001',
-        'recording_uuid': 'rec-uuid-001',
-        'filename': 'test_recording.wav',
-        'file_size': 320000,
-        'file_hash': 'abc123def456',
-        'actual_duration': 10
-    }
+    return dict(_SAMPLE_RECORDING_COMPLETED_DATA)
 
 
 # Markers
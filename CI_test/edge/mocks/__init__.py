@@ -3,3 +3,4 @@ Mock modules for edge client testing
 """
 from .mock_server import MockSocketIOServer
 from .mock_audio import MockSoundDevice, MockAudioManager
+from .mock_clock import FakeClock
@@ -5,12 +5,49 @@ import os
 import time
 import hashlib
 import tempfile
-import numpy as np
-from typing import Dict, Any, List, Optional, Callable
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Callable, Tuple
 from dataclasses import dataclass
 
+if TYPE_CHECKING:
+    import numpy as np
 
-@dataclass
+from CI_test.mocks.wav import pack_wav_header, write_silent_wav
+
+# Seconds to sleep per simulated step; 0 (the default) runs mock recordings instantly
+MOCK_AUDIO_SLEEP = float(os.environ.get('MOCK_AUDIO_SLEEP', '0'))
+
+# Reusable block of silence for hashing zero-filled WAV payloads
+_ZERO_BLOCK = memoryview(bytes(64 * 1024))
+
+
+@lru_cache(maxsize=None)
+def _silent_wav_sha256(num_frames: int, sample_rate: int, channels: int) -> str:
+    """SHA-256 of the file write_silent_wav produces; it depends only on the format"""
+    digest = hashlib.sha256(pack_wav_header(num_frames, sample_rate, channels))
+    remaining = num_frames * channels * 2
+    while remaining:
+        chunk = min(remaining, len(_ZERO_BLOCK))
+        digest.update(_ZERO_BLOCK[:chunk])
+        remaining -= chunk
+    return digest.hexdigest()
+
+
+# One zero sample per dtype, broadcast to any shape by MockSoundDevice.rec
+_ZERO_SAMPLE: Dict[str, 'np.ndarray'] = {}
+
+
+def _silence(frames: int, channels: int, dtype: str) -> 'np.ndarray':
+    """Read-only (frames, channels) view of silence, backed by a single sample"""
+    import numpy as np
+
+    zero = _ZERO_SAMPLE.get(dtype)
+    if zero is None:
+        zero = _ZERO_SAMPLE[dtype] = np.zeros(1, dtype=dtype)
+    return np.broadcast_to(zero, (frames, channels))
+
+
+@dataclass(slots=True)
 class MockAudioDevice:
     """Mock audio device information"""
     index: int
@@ -33,9 +70,22 @@ class MockSoundDevice:
 
     def __init__(self):
         self._devices: List[MockAudioDevice] = []
-        self._recording_data: Optional[np.ndarray] = None
+        self._recording_data: Optional['np.ndarray'] = None
         self._is_recording = False
         self._recording_error: Optional[Exception] = None
+        # Serialized query_devices() results, rebuilt after add_device/clear_devices
+        self._device_cache: Optional[List[Dict[str, Any]]] = None
+        self._input_cache: Optional[List[Dict[str, Any]]] = None
+
+        self._reset()
+
+    def _reset(self) -> None:
+        """Return to the just-constructed state: default device only, no error"""
+        self._devices.clear()
+        self._recording_data = None
+        self._is_recording = False
+        self._recording_error = None
+        self._invalidate_device_cache()
 
         # Add default device
         self._devices.append(MockAudioDevice(
@@ -48,44 +98,57 @@ class MockSoundDevice:
     def add_device(self, device: MockAudioDevice):
         """Add a mock audio device"""
         self._devices.append(device)
+        self._invalidate_device_cache()
 
     def clear_devices(self):
         """Clear all mock devices"""
         self._devices.clear()
+        self._invalidate_device_cache()
+
+    def _invalidate_device_cache(self):
+        """Drop the cached query_devices() results"""
+        self._device_cache = None
+        self._input_cache = None
+
+    def _device_dicts(self) -> List[Dict[str, Any]]:
+        """Device dicts as returned by query_devices, built once per device set"""
+        if self._device_cache is None:
+            self._device_cache = [
+                {
+                    'name': d.name,
+                    'index': d.index,
+                    'max_input_channels': d.max_input_channels,
+                    'max_output_channels': d.max_output_channels,
+                    'default_samplerate': d.default_samplerate,
+                    'hostapi': d.hostapi
+                }
+                for d in self._devices
+            ]
+        return self._device_cache
 
     def query_devices(self, device=None, kind=None):
-        """Mock query_devices function"""
+        """
+        Mock query_devices function
+
+        A single device comes back as a copy. The dicts inside the returned
+        lists are cached and shared between calls; treat them as read-only.
+        Each call still returns a new list.
+        """
         if device is not None:
             if isinstance(device, int):
-                for d in self._devices:
-                    if d.index == device:
-                        return {
-                            'name': d.name,
-                            'index': d.index,
-                            'max_input_channels': d.max_input_channels,
-                            'max_output_channels': d.max_output_channels,
-                            'default_samplerate': d.default_samplerate,
-                            'hostapi': d.hostapi
-                        }
+                for d in self._device_dicts():
+                    if d['index'] == device:
+                        return dict(d)
                 raise ValueError(f"Invalid device index: {device}")
             return self.query_devices()
 
-        # Return all devices
-        result = []
-        for d in self._devices:
-            result.append({
-                'name': d.name,
-                'index': d.index,
-                'max_input_channels': d.max_input_channels,
-                'max_output_channels': d.max_output_channels,
-                'default_samplerate': d.default_samplerate,
-                'hostapi': d.hostapi
-            })
-
         if kind == 'input':
-            result = [d for d in result if d['max_input_channels'] > 0]
+            if self._input_cache is None:
+                self._input_cache = [d for d in self._device_dicts() if d['max_input_channels'] > 0]
+            return list(self._input_cache)
 
-        return result
+        # Return all devices
+        return list(self._device_dicts())
 
     def set_recording_error(self, error: Exception):
         """Set an error to be raised during recording"""
@@ -98,19 +161,24 @@ class MockSoundDevice:
     def rec(self, frames: int, samplerate: int, channels: int,
             dtype: str = 'float32', device: int = None,
             blocking: bool = True):
-        """Mock rec function"""
+        """
+        Mock rec function
+
+        Returns read-only silence shared between calls; copy it before writing.
+        """
         if self._recording_error:
             raise self._recording_error
 
         self._is_recording = True
 
-        # Generate mock audio data (silence with some noise)
+        # Mock audio data: a slice of the cached silence, no per-call allocation
         duration = frames / samplerate
-        data = np.random.randn(frames, channels).astype(dtype) * 0.01
+        data = _silence(frames, channels, dtype)
 
         if blocking:
-            # Simulate recording time (but faster for tests)
-            time.sleep(min(duration * 0.1, 1.0))  # Cap at 1 second for tests
+            # Simulate recording time only when MOCK_AUDIO_SLEEP asks for it
+            if MOCK_AUDIO_SLEEP:
+                time.sleep(min(duration * 0.1, 1.0))  # Cap at 1 second for tests
             self._is_recording = False
 
         self._recording_data = data
@@ -138,14 +206,25 @@ class MockAudioManager:
 
     def __init__(self, temp_dir: str = 'temp_wav'):
         self.temp_dir = temp_dir
+        # SHA-256 digests keyed by (path, st_mtime_ns, st_size)
+        self._hash_cache: Dict[Tuple[str, int, int], str] = {}
         self.mock_sd = MockSoundDevice()
         self._recorded_files: List[str] = []
         self._should_fail = False
         self._progress_callback: Optional[Callable] = None
+        self._sleep_per_step = MOCK_AUDIO_SLEEP
 
         # Create temp directory
         os.makedirs(temp_dir, exist_ok=True)
 
+    def _reset(self) -> None:
+        """Remove recordings and return to the just-constructed state"""
+        self.cleanup()
+        self._hash_cache.clear()
+        self._should_fail = False
+        self._progress_callback = None
+        self.mock_sd._reset()
+
     def set_should_fail(self, should_fail: bool):
         """Set whether recording should fail"""
         self._should_fail = should_fail
@@ -179,15 +258,15 @@ class MockAudioManager:
             }
 
         # Check device index
-        device_indices = [d['index'] for d in devices]
-        if device_index not in device_indices:
+        by_index = {d['index']: d for d in devices}
+        device = by_index.get(device_index)
+        if device is None:
             return {
                 'valid': False,
                 'error': f'Invalid device index: {device_index}'
             }
 
         # Check channels
-        device = next(d for d in devices if d['index'] == device_index)
         if channels > device['max_input_channels']:
             return {
                 'valid': False,
@@ -214,7 +293,8 @@ class MockAudioManager:
         # Simulate progress
         total_steps = 10
         for i in range(total_steps):
-            time.sleep(0.05)  # Small delay for testing
+            if self._sleep_per_step:
+                time.sleep(self._sleep_per_step)
             if progress_callback:
                 try:
                     progress_callback(int((i + 1) / total_steps * 100))
@@ -235,29 +315,30 @@ class MockAudioManager:
     def _create_mock_wav(self, filename: str, duration: int,
                          sample_rate: int, channels: int):
         """Create a mock WAV file for testing"""
-        import wave
-        import struct
+        num_frames = duration * sample_rate
+        write_silent_wav(filename, num_frames, sample_rate, channels)
 
-        # Generate silence data
-        num_samples = duration * sample_rate
-        data = b'\x00\x00' * num_samples * channels
-
-        with wave.open(filename, 'wb') as wav_file:
-            wav_file.setnchannels(channels)
-            wav_file.setsampwidth(2)  # 16-bit
-            wav_file.setframerate(sample_rate)
-            wav_file.writeframes(data)
+        # The content is fixed by the format, so get_file_info needn't re-read it
+        st = os.stat(filename)
+        self._hash_cache[(filename, st.st_mtime_ns, st.st_size)] = _silent_wav_sha256(
+            num_frames, sample_rate, channels
+        )
 
     def get_file_info(self, filename: str) -> Dict[str, Any]:
         """Get information about a recorded file"""
-        if not os.path.exists(filename):
+        try:
+            st = os.stat(filename)
+        except FileNotFoundError:
             return {}
+        file_size = st.st_size
 
-        file_size = os.path.getsize(filename)
-
-        # Calculate hash
-        with open(filename, 'rb') as f:
-            file_hash = hashlib.sha256(f.read()).hexdigest()
+        # Reuse the digest while the file is unchanged, else stream it through hashlib
+        key = (filename, st.st_mtime_ns, file_size)
+        file_hash = self._hash_cache.get(key)
+        if file_hash is None:
+            with open(filename, 'rb') as f:
+                file_hash = hashlib.file_digest(f, 'sha256').hexdigest()
+            self._hash_cache[key] = file_hash
 
         return {
             'filename': os.path.basename(filename),
@@ -270,6 +351,12 @@ class MockAudioManager:
     def cleanup(self):
         """Clean up recorded files"""
         for f in self._recorded_files:
-            if os.path.exists(f):
+            try:
                 os.remove(f)
+            except FileNotFoundError:
+                pass
+
+        removed = set(self._recorded_files)
+        for key in [k for k in self._hash_cache if k[0] in removed]:
+            del self._hash_cache[key]
         self._recorded_files.clear()
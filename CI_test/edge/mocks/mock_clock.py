@@ -0,0 +1,35 @@
+"""
+Mock clock for testing polling loops without real sleeps
+"""
+import threading
+import time
+
+# The real sleep, captured before any test patches time.sleep
+_real_sleep = time.sleep
+
+
+class FakeClock:
+    """
+    Virtual clock whose sleep() advances time instead of blocking
+
+    Usage:
+        clock = FakeClock()
+        # Patch time.sleep with clock.sleep
+        clock.sleep(5)
+        assert clock.now == 5
+    """
+
+    def __init__(self, start: float = 0.0):
+        self.now = start
+        self._lock = threading.Lock()
+
+    def time(self) -> float:
+        """Current virtual time in seconds"""
+        return self.now
+
+    def sleep(self, seconds: float):
+        """Advance virtual time by seconds and let other threads run"""
+        with self._lock:
+            self.now += seconds
+        # Yield the GIL so a loop polling in one thread can't starve the test
+        _real_sleep(0)
@@ -8,7 +8,7 @@ from typing import Dict, Any, Optional, Callable, List
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class MockEvent:
     """Represents a captured event"""
     event_name: str
@@ -36,8 +36,13 @@ class MockSocketIOServer:
         """
         self.auto_respond = auto_respond
         self.received_events: List[MockEvent] = []
+        # Same events grouped by name, so lookups don't scan the whole log
+        self._events_by_name: Dict[str, List[MockEvent]] = {}
+        # Keeps the log and the name index in step across record and clear
+        self._events_lock = threading.Lock()
         self.event_handlers: Dict[str, Callable] = {}
         self.connected_clients: Dict[str, Dict[str, Any]] = {}
+        # Guards connected_clients
         self._lock = threading.Lock()
 
         # Simulated server state
@@ -72,8 +77,10 @@ class MockSocketIOServer:
             data: Event data
             client_id: Client identifier
         """
-        with self._lock:
-            self.received_events.append(MockEvent(event_name=event, data=data))
+        mock_event = MockEvent(event_name=event, data=data)
+        with self._events_lock:
+            self.received_events.append(mock_event)
+            self._events_by_name.setdefault(event, []).append(mock_event)
 
         # Handle auto-responses
         if self.auto_respond:
@@ -93,18 +100,18 @@ class MockSocketIOServer:
 
     def get_events_by_name(self, event_name: str) -> List[MockEvent]:
         """Get all events with specific name"""
-        with self._lock:
-            return [e for e in self.received_events if e.event_name == event_name]
+        return list(self._events_by_name.get(event_name, ()))
 
     def get_last_event(self, event_name: str) -> Optional[MockEvent]:
         """Get the last event with specific name"""
-        events = self.get_events_by_name(event_name)
+        events = self._events_by_name.get(event_name)
         return events[-1] if events else None
 
     def clear_events(self):
         """Clear all received events"""
-        with self._lock:
+        with self._events_lock:
             self.received_events.clear()
+            self._events_by_name.clear()
 
     def simulate_disconnect(self, client_id: str = 'default'):
         """Simulate server-side disconnect"""
@@ -140,7 +147,9 @@ class MockSocketIOClient:
         self._connected = False
         self._handlers: Dict[str, Callable] = {}
         self.emitted_events: List[MockEvent] = []
-        self._lock = threading.Lock()
+        # Same events grouped by name, updated with the log under _events_lock
+        self._events_by_name: Dict[str, List[MockEvent]] = {}
+        self._events_lock = threading.Lock()
 
     @property
     def connected(self) -> bool:
@@ -155,8 +164,10 @@ class MockSocketIOClient:
 
     def emit(self, event: str, data: Any):
         """Emit an event"""
-        with self._lock:
-            self.emitted_events.append(MockEvent(event_name=event, data=data))
+        mock_event = MockEvent(event_name=event, data=data)
+        with self._events_lock:
+            self.emitted_events.append(mock_event)
+            self._events_by_name.setdefault(event, []).append(mock_event)
 
     def connect(self, url: str, wait_timeout: int = 10):
         """Simulate connection"""
@@ -185,10 +196,10 @@ class MockSocketIOClient:
 
     def get_emitted_events(self, event_name: str) -> List[MockEvent]:
         """Get all emitted events with specific name"""
-        with self._lock:
-            return [e for e in self.emitted_events if e.event_name == event_name]
+        return list(self._events_by_name.get(event_name, ()))
 
     def clear_events(self):
         """Clear all emitted events"""
-        with self._lock:
+        with self._events_lock:
             self.emitted_events.clear()
+            self._events_by_name.clear()
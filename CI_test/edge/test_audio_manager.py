@@ -2,10 +2,24 @@
 Tests for AudioManager module
 """
 import os
+import hashlib
 import pytest
 from unittest.mock import patch, MagicMock
 
 from CI_test.edge.mocks.mock_audio import MockSoundDevice, MockAudioDevice
+from CI_test.mocks.wav import WAV_HEADER
+
+
+def _wav_format(path: str):
+    """(channels, sample_rate) read straight from a canonical 44-byte WAV header"""
+    with open(path, 'rb') as f:
+        fields = WAV_HEADER.unpack_from(f.read(WAV_HEADER.size))
+
+    riff, _, wave, fmt, _, audio_format, channels, sample_rate = fields[:8]
+    assert riff == b'RIFF' and wave == b'WAVE', "not a RIFF/WAVE file"
+    assert fmt == b'fmt ' and fields[11] == b'data', "unexpected chunk layout"
+    assert audio_format == 1, "not PCM"
+    return channels, sample_rate
 
 
 class TestAudioManager:
@@ -104,18 +118,9 @@ class TestAudioManager:
 
         assert filename is None
 
-    def test_get_file_info(self, mock_audio_manager):
+    def test_get_file_info(self, mock_audio_manager, recorded_wav: str):
         """Test getting file information"""
-        # First create a recording
-        filename = mock_audio_manager.record(
-            duration=1,
-            sample_rate=16000,
-            channels=1,
-            device_index=0,
-            device_name='test'
-        )
-
-        file_info = mock_audio_manager.get_file_info(filename)
+        file_info = mock_audio_manager.get_file_info(recorded_wav)
 
         assert 'filename' in file_info
         assert 'file_size' in file_info
@@ -128,20 +133,30 @@ class TestAudioManager:
 
         assert file_info == {}
 
-    def test_file_hash_consistency(self, mock_audio_manager):
+    def test_file_hash_consistency(self, mock_audio_manager, recorded_wav: str):
         """Test that file hash is consistent"""
+        # recorded_wav comes from another manager, so the first call hashes the file
+        info1 = mock_audio_manager.get_file_info(recorded_wav)
+        info2 = mock_audio_manager.get_file_info(recorded_wav)
+
+        with open(recorded_wav, 'rb') as f:
+            expected = hashlib.sha256(f.read()).hexdigest()
+        assert info1['file_hash'] == expected
+        assert info2['file_hash'] == expected
+
+    def test_file_hash_matches_content(self, mock_audio_manager):
+        """Test that the hash recorded with a new file matches its bytes"""
         filename = mock_audio_manager.record(
             duration=1,
-            sample_rate=16000,
-            channels=1,
+            sample_rate=8000,
+            channels=2,
             device_index=0,
             device_name='test'
         )
 
-        info1 = mock_audio_manager.get_file_info(filename)
-        info2 = mock_audio_manager.get_file_info(filename)
-
-        assert info1['file_hash'] == info2['file_hash']
+        with open(filename, 'rb') as f:
+            expected = hashlib.sha256(f.read()).hexdigest()
+        assert mock_audio_manager.get_file_info(filename)['file_hash'] == expected
 
 
 class TestMockSoundDevice:
@@ -213,27 +228,15 @@ class TestMockSoundDevice:
 class TestAudioFileFormats:
     """Tests for audio file format handling"""
 
-    def test_wav_file_created(self, mock_audio_manager):
+    def test_wav_file_created(self, recorded_wav: str):
         """Test that WAV file is created correctly"""
-        import wave
-
-        filename = mock_audio_manager.record(
-            duration=1,
-            sample_rate=16000,
-            channels=1,
-            device_index=0,
-            device_name='test'
-        )
-
         # Verify it's a valid WAV file
-        with wave.open(filename, 'rb') as wav:
-            assert wav.getnchannels() == 1
-            assert wav.getframerate() == 16000
+        channels, sample_rate = _wav_format(recorded_wav)
+        assert channels == 1
+        assert sample_rate == 16000
 
     def test_stereo_recording(self, mock_audio_manager):
         """Test stereo recording"""
-        import wave
-
         filename = mock_audio_manager.record(
             duration=1,
             sample_rate=16000,
@@ -242,5 +245,5 @@ class TestAudioFileFormats:
             device_name='test'
         )
 
-        with wave.open(filename, 'rb') as wav:
-            assert wav.getnchannels() == 2
+        channels, _ = _wav_format(filename)
+        assert channels == 2
@@ -3,8 +3,73 @@ Tests for ConfigManager module
 """
 import os
 import json
+import itertools
 import pytest
-from unittest.mock import patch
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator
+
+from config_manager import ConfigManager
+
+
+# Config shared by the TestAudioConfig cases; each case overrides the audio fields
+_BASE_AUDIO_CONFIG = {
+    "default_device_index": 0,
+    "channels": 1,
+    "sample_rate": 16000,
+    "bit_depth": 16
+}
+
+_BASE_CONFIG = {
+    "server_url": "http://localhost:55103",
+    "heartbeat_interval": 30,
+    "reconnect_delay": 5,
+    "max_reconnect_delay": 60,
+    "temp_wav_dir": "temp_wav"
+}
+
+
+@pytest.fixture(scope="module")
+def audio_config_file(tmp_path_factory: pytest.TempPathFactory) -> Callable[..., str]:
+    """
+    Return a function mapping audio_config overrides to a read-only config path
+
+    Each distinct audio_config is written once per module, so cases that
+    resolve to the same config (e.g. the defaults) share a file.
+    """
+    directory = tmp_path_factory.mktemp('audio_config_')
+    written: Dict[tuple, str] = {}
+
+    def get(**audio_overrides) -> str:
+        audio_config = {**_BASE_AUDIO_CONFIG, **audio_overrides}
+        key = tuple(sorted(audio_config.items()))
+        if key not in written:
+            config_path = directory / f'device_config_{len(written)}.json'
+            config_data = {**_BASE_CONFIG, "audio_config": audio_config}
+            config_path.write_bytes(json.dumps(config_data).encode('utf-8'))
+            written[key] = str(config_path)
+        return written[key]
+
+    return get
+
+
+@contextmanager
+def _env_override(key: str, value: str) -> Iterator[None]:
+    """
+    Set a single environment variable for the duration of the block
+
+    Saves and restores just that key, rather than snapshotting all of
+    os.environ the way patch.dict does.
+    """
+    previous = os.environ.get(key)
+    os.environ[key] = value
+    try:
+        yield
+    finally:
+        if previous is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = previous
 
 
 class TestConfigManager:
@@ -12,8 +77,6 @@ class TestConfigManager:
 
     def test_load_valid_config(self, config_file: str, sample_config: dict):
         """Test loading a valid configuration file"""
-        from config_manager import ConfigManager
-
         manager = ConfigManager(config_file)
         config = manager.load()
 
@@ -22,10 +85,8 @@ class TestConfigManager:
         assert config.server_url == sample_config['server_url']
         assert config.heartbeat_interval == sample_config['heartbeat_interval']
 
-    def test_load_config_with_missing_device_id(self, temp_dir: str):
+    def test_load_config_with_missing_device_id(self, tmp_path: Path):
         """Test loading config without device_id (should auto-generate)"""
-        from config_manager import ConfigManager
-
         config_data = {
             "device_name": "Test_Device",
             "server_url": "http://localhost:55103",
@@ -41,23 +102,19 @@ class TestConfigManager:
             "temp_wav_dir": "temp_wav"
         }
 
-        config_path = os.path.join(temp_dir, 'device_config.json')
-        with open(config_path, 'w', encoding='utf-8') as f:
-            json.dump(config_data, f)
+        config_path = tmp_path / 'device_config.json'
+        config_path.write_text(json.dumps(config_data), encoding='utf-8')
 
-        manager = ConfigManager(config_path)
+        manager = ConfigManager(str(config_path))
         config = manager.load()
 
         # device_id should be auto-generated or None
         # (depends on implementation - check your ConfigManager)
         assert config.device_name == "Test_Device"
 
-    def test_load_config_file_not_found(self, temp_dir: str):
+    def test_load_config_file_not_found(self, tmp_path: Path):
         """Test loading non-existent config file"""
-        from config_manager import ConfigManager
-
-        config_path = os.path.join(temp_dir, 'nonexistent.json')
-        manager = ConfigManager(config_path)
+        manager = ConfigManager(str(tmp_path / 'nonexistent.json'))
 
         # Should either raise exception or create default config
         # Adjust assertion based on actual behavior
@@ -68,11 +125,9 @@ class TestConfigManager:
         except FileNotFoundError:
             pass  # Expected behavior
 
-    def test_save_config(self, config_file: str, sample_config: dict):
+    def test_save_config(self, mutable_config_file: str):
         """Test saving configuration"""
-        from config_manager import ConfigManager
-
-        manager = ConfigManager(config_file)
+        manager = ConfigManager(mutable_config_file)
         config = manager.load()
 
         # Modify config
@@ -81,15 +136,13 @@ class TestConfigManager:
         manager.save()
 
         # Reload and verify
-        with open(config_file, 'r', encoding='utf-8') as f:
+        with open(mutable_config_file, 'r', encoding='utf-8') as f:
             saved_data = json.load(f)
 
         assert saved_data['device_name'] == new_name
 
-    def test_audio_config_defaults(self, temp_dir: str):
+    def test_audio_config_defaults(self, tmp_path: Path):
         """Test audio configuration defaults"""
-        from config_manager import ConfigManager
-
         config_data = {
             "server_url": "http://localhost:55103",
             "heartbeat_interval": 30,
@@ -98,11 +151,10 @@ class TestConfigManager:
             "temp_wav_dir": "temp_wav"
         }
 
-        config_path = os.path.join(temp_dir, 'device_config.json')
-        with open(config_path, 'w', encoding='utf-8') as f:
-            json.dump(config_data, f)
+        config_path = tmp_path / 'device_config.json'
+        config_path.write_text(json.dumps(config_data), encoding='utf-8')
 
-        manager = ConfigManager(config_path)
+        manager = ConfigManager(str(config_path))
         config = manager.load()
 
         # Check default audio config values
@@ -111,19 +163,15 @@ class TestConfigManager:
 
     def test_environment_variable_override(self, config_file: str):
         """Test environment variable overrides config file values"""
-        from config_manager import ConfigManager
-
-        with patch.dict(os.environ, {'EDGE_SERVER_URL': 'http://override:8080'}):
+        with _env_override('EDGE_SERVER_URL', 'http://override:8080'):
             manager = ConfigManager(config_file)
             config = manager.load()
 
             # If ConfigManager supports env override, verify it
             # Adjust based on actual implementation
 
-    def test_config_validation_invalid_url(self, temp_dir: str):
+    def test_config_validation_invalid_url(self, tmp_path: Path):
         """Test config validation with invalid server URL"""
-        from config_manager import ConfigManager
-
         config_data = {
             "server_url": "invalid-url",
             "heartbeat_interval": 30,
@@ -132,11 +180,10 @@ class TestConfigManager:
             "temp_wav_dir": "temp_wav"
         }
 
-        config_path = os.path.join(temp_dir, 'device_config.json')
-        with open(config_path, 'w', encoding='utf-8') as f:
-            json.dump(config_data, f)
+        config_path = tmp_path / 'device_config.json'
+        config_path.write_text(json.dumps(config_data), encoding='utf-8')
 
-        manager = ConfigManager(config_path)
+        manager = ConfigManager(str(config_path))
 
         # Should either raise validation error or fix the URL
         try:
@@ -145,10 +192,8 @@ class TestConfigManager:
         except ValueError:
             pass  # Expected if validation is strict
 
-    def test_heartbeat_interval_bounds(self, temp_dir: str):
+    def test_heartbeat_interval_bounds(self, tmp_path: Path):
         """Test heartbeat interval validation"""
-        from config_manager import ConfigManager
-
         # Test with very small interval
         config_data = {
             "server_url": "http://localhost:55103",
@@ -158,11 +203,10 @@ class TestConfigManager:
             "temp_wav_dir": "temp_wav"
         }
 
-        config_path = os.path.join(temp_dir, 'device_config.json')
-        with open(config_path, 'w', encoding='utf-8') as f:
-            json.dump(config_data, f)
+        config_path = tmp_path / 'device_config.json'
+        config_path.write_text(json.dumps(config_data), encoding='utf-8')
 
-        manager = ConfigManager(config_path)
+        manager = ConfigManager(str(config_path))
         config = manager.load()
 
         # ConfigManager currently accepts any value - verify it loads
@@ -172,90 +216,20 @@ class TestConfigManager:
 class TestAudioConfig:
     """Tests for AudioConfig validation"""
 
-    def test_valid_sample_rates(self, temp_dir: str):
-        """Test valid sample rates"""
-        from config_manager import ConfigManager
-
-        valid_rates = [8000, 16000, 22050, 44100, 48000]
-
-        for rate in valid_rates:
-            config_data = {
-                "server_url": "http://localhost:55103",
-                "audio_config": {
-                    "default_device_index": 0,
-                    "channels": 1,
-                    "sample_rate": rate,
-                    "bit_depth": 16
-                },
-                "heartbeat_interval": 30,
-                "reconnect_delay": 5,
-                "max_reconnect_delay": 60,
-                "temp_wav_dir": "temp_wav"
-            }
-
-            config_path = os.path.join(temp_dir, 'device_config.json')
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f)
-
-            manager = ConfigManager(config_path)
-            config = manager.load()
-
-            assert config.audio_config.sample_rate == rate
-
-    def test_valid_bit_depths(self, temp_dir: str):
-        """Test valid bit depths"""
-        from config_manager import ConfigManager
-
-        valid_depths = [16, 32]
-
-        for depth in valid_depths:
-            config_data = {
-                "server_url": "http://localhost:55103",
-                "audio_config": {
-                    "default_device_index": 0,
-                    "channels": 1,
-                    "sample_rate": 16000,
-                    "bit_depth": depth
-                },
-                "heartbeat_interval": 30,
-                "reconnect_delay": 5,
-                "max_reconnect_delay": 60,
-                "temp_wav_dir": "temp_wav"
-            }
-
-            config_path = os.path.join(temp_dir, 'device_config.json')
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f)
-
-            manager = ConfigManager(config_path)
-            config = manager.load()
-
-            assert config.audio_config.bit_depth == depth
-
-    def test_channel_count(self, temp_dir: str):
-        """Test channel count configuration"""
-        from config_manager import ConfigManager
-
-        for channels in [1, 2]:
-            config_data = {
-                "server_url": "http://localhost:55103",
-                "audio_config": {
-                    "default_device_index": 0,
-                    "channels": channels,
-                    "sample_rate": 16000,
-                    "bit_depth": 16
-                },
-                "heartbeat_interval": 30,
-                "reconnect_delay": 5,
-                "max_reconnect_delay": 60,
-                "temp_wav_dir": "temp_wav"
-            }
-
-            config_path = os.path.join(temp_dir, 'device_config.json')
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f)
-
-            manager = ConfigManager(config_path)
-            config = manager.load()
+    @pytest.mark.parametrize("rate,depth,channels", list(itertools.product(
+        [8000, 16000, 22050, 44100, 48000], [16, 32], [1, 2]
+    )))
+    def test_audio_config_matrix(self, audio_config_file: Callable[..., str],
+                                 rate: int, depth: int, channels: int):
+        """Test loading valid sample rate / bit depth / channel combinations"""
+        manager = ConfigManager(audio_config_file(
+            sample_rate=rate, bit_depth=depth, channels=channels
+        ))
+        config = manager.load()
 
-            assert config.audio_config.channels == channels
+        assert config.audio_config.to_dict() == {
+            **_BASE_AUDIO_CONFIG,
+            "sample_rate": rate,
+            "bit_depth": depth,
+            "channels": channels
+        }
@@ -12,6 +12,7 @@ import threading
 import pytest
 from unittest.mock import MagicMock, patch, PropertyMock
 
+from CI_test.edge.mocks.mock_clock import FakeClock
 from CI_test.edge.mocks.mock_server import MockSocketIOClient, MockSocketIOServer
 
 
@@ -90,10 +91,9 @@ class TestPingPongTimeout:
 
         assert is_timed_out is True
 
-    def test_heartbeat_detects_connection_loss(self):
+    def test_heartbeat_detects_connection_loss(self, fake_clock: FakeClock):
         """Test that heartbeat loop can detect connection loss"""
-        sio_connected = True
-        _connected = True
+        sio_disconnected = threading.Event()
         heartbeat_stopped = False
 
         def heartbeat_loop():
@@ -103,12 +103,11 @@ class TestPingPongTimeout:
 
             while True:
                 # Key check: verify actual connection state
-                if not sio_connected:
-                    _connected = False
+                if sio_disconnected.is_set():
                     heartbeat_stopped = True
                     break
 
-                # Simulate heartbeat
+                # Simulate heartbeat (virtual time, returns immediately)
                 time.sleep(0.1)
 
                 if consecutive_failures >= max_failures:
@@ -120,12 +119,9 @@ class TestPingPongTimeout:
         thread.daemon = True
         thread.start()
 
-        # Simulate connection loss
-        time.sleep(0.2)
-        sio_connected = False
-
-        # Wait for detection
-        time.sleep(0.3)
+        # Simulate connection loss, then wait for detection
+        sio_disconnected.set()
+        thread.join(timeout=1)
 
         assert heartbeat_stopped is True
 
@@ -158,20 +154,11 @@ class TestAutoReconnect:
         initial_delay = 5
         max_delay = 60
 
-        delays = []
-        current_delay = initial_delay
-
-        for _ in range(10):
-            delays.append(current_delay)
-            current_delay = min(current_delay * 2, max_delay)
+        # Closed form of "double, then cap": attempt n waits min(initial * 2**n, max)
+        delays = [min(initial_delay * 2 ** attempt, max_delay) for attempt in range(10)]
 
-        # Verify exponential increase
-        assert delays[0] == 5
-        assert delays[1] == 10
-        assert delays[2] == 20
-        assert delays[3] == 40
-        assert delays[4] == 60  # Capped at max
-        assert delays[5] == 60  # Stays at max
+        # Verify exponential increase, capped at max and staying there
+        assert delays == [5, 10, 20, 40] + [60] * 6
 
     def test_reconnect_preserves_device_id(self, mock_socketio_client: MockSocketIOClient):
         """Test that device_id is preserved across reconnections"""
@@ -198,16 +185,16 @@ class TestAutoReconnect:
 class TestHeartbeatResilience:
     """Tests for heartbeat thread resilience"""
 
-    def test_heartbeat_stops_on_disconnect(self):
+    def test_heartbeat_stops_on_disconnect(self, fake_clock: FakeClock):
         """Test that heartbeat thread stops when disconnected"""
         heartbeat_running = True
-        _connected = True
+        disconnect_event = threading.Event()
         stop_event = threading.Event()
 
         def heartbeat_loop():
             nonlocal heartbeat_running
             while not stop_event.is_set():
-                if not _connected:
+                if disconnect_event.wait(timeout=0):
                     heartbeat_running = False
                     break
                 time.sleep(0.1)
@@ -217,12 +204,11 @@ class TestHeartbeatResilience:
         thread.daemon = True
         thread.start()
 
-        # Simulate disconnect
-        time.sleep(0.2)
-        _connected = False
+        # Simulate disconnect, then wait for stop
+        disconnect_event.set()
+        thread.join(timeout=1)
 
-        # Wait for stop
-        time.sleep(0.3)
+        assert not thread.is_alive()
         assert heartbeat_running is False
 
     def test_heartbeat_restarts_on_reconnect(self):
@@ -412,6 +398,39 @@ class TestEdgeCases:
         assert recording_uuid is None
 
 
+# Heartbeat startup delay in FSM ticks; one tick stands for 0.5 s of the 1 s delay
+STARTUP_TICKS = 2
+
+
+class HeartbeatFSM:
+    """
+    Heartbeat loop modelled as a state machine stepped from the test thread
+
+    STARTING waits STARTUP_TICKS steps for sio.connected to settle, then
+    CHECKING resolves to OK or FAILED on the next step. Both end states are final.
+    """
+
+    STARTING = 'starting'
+    CHECKING = 'checking'
+    OK = 'ok'
+    FAILED = 'failed'
+
+    def __init__(self, startup_ticks: int = STARTUP_TICKS):
+        self.startup_ticks = startup_ticks
+        self.ticks = 0
+        self.state = self.STARTING if startup_ticks else self.CHECKING
+
+    def step(self, sio_connected: bool) -> str:
+        """Advance one tick given the current sio.connected and return the new state"""
+        if self.state == self.STARTING:
+            self.ticks += 1
+            if self.ticks >= self.startup_ticks:
+                self.state = self.CHECKING
+        elif self.state == self.CHECKING:
+            self.state = self.OK if sio_connected else self.FAILED
+        return self.state
+
+
 class TestHeartbeatRaceCondition:
     """Tests for heartbeat thread race condition issues"""
 
@@ -422,53 +441,18 @@ class TestHeartbeatRaceCondition:
         Issue: Heartbeat thread starts in on_connect callback but
         sio.connected might not be True yet, causing false disconnect detection.
         """
-        sio_connected = False  # Simulates state during on_connect callback
-        heartbeat_detected_disconnect = False
-        startup_delay = 1  # seconds
-
-        def heartbeat_loop_with_delay():
-            nonlocal heartbeat_detected_disconnect
-            # Wait for connection to stabilize
-            time.sleep(startup_delay)
-
-            # Now check connection
-            if not sio_connected:
-                heartbeat_detected_disconnect = True
-
-        def heartbeat_loop_without_delay():
-            nonlocal heartbeat_detected_disconnect
-            # Immediately check connection (problematic)
-            if not sio_connected:
-                heartbeat_detected_disconnect = True
-
         # Test without delay - should detect false disconnect
-        heartbeat_detected_disconnect = False
-        sio_connected = False
-        thread = threading.Thread(target=heartbeat_loop_without_delay)
-        thread.start()
-        thread.join(timeout=2)
-        assert heartbeat_detected_disconnect is True  # False positive
-
-        # Test with delay - connection stabilizes before check
-        heartbeat_detected_disconnect = False
-        sio_connected = False
+        heartbeat = HeartbeatFSM(startup_ticks=0)
+        assert heartbeat.step(sio_connected=False) == HeartbeatFSM.FAILED  # False positive
+        assert heartbeat.step(sio_connected=True) == HeartbeatFSM.FAILED
 
-        def delayed_set_connected():
-            time.sleep(0.5)
-            nonlocal sio_connected
-            sio_connected = True
-
-        connect_thread = threading.Thread(target=delayed_set_connected)
-        connect_thread.start()
-
-        thread = threading.Thread(target=heartbeat_loop_with_delay)
-        thread.start()
-        thread.join(timeout=2)
-        connect_thread.join(timeout=2)
+        # Test with delay - connection stabilizes (after one tick) before check
+        heartbeat = HeartbeatFSM()
+        assert heartbeat.step(sio_connected=False) == HeartbeatFSM.STARTING
+        assert heartbeat.step(sio_connected=True) == HeartbeatFSM.CHECKING
+        assert heartbeat.step(sio_connected=True) == HeartbeatFSM.OK  # Correct behavior
 
-        assert heartbeat_detected_disconnect is False  # Correct behavior
-
-    def test_already_connected_error_handling(self):
+    def test_already_connected_error_handling(self, fake_clock: FakeClock):
         """
         Test handling of 'Already connected' error during reconnection.
 
@@ -528,46 +512,44 @@ class TestConnectionMonitoring:
 
     def test_monitor_checks_sio_connected(self):
         """Test that monitor checks sio.connected property"""
-        sio_connected = True
+        sio_disconnected = threading.Event()
         detected_disconnect = False
 
         def monitor_loop():
             nonlocal detected_disconnect
             for _ in range(10):
-                if not sio_connected:
+                # Poll interval that wakes as soon as the state changes
+                if sio_disconnected.wait(timeout=0.05):
                     detected_disconnect = True
                     break
-                time.sleep(0.05)
 
         thread = threading.Thread(target=monitor_loop)
         thread.start()
 
         # Simulate disconnect
-        time.sleep(0.1)
-        sio_connected = False
+        sio_disconnected.set()
 
         thread.join(timeout=1)
         assert detected_disconnect is True
 
     def test_monitor_checks_internal_state(self):
         """Test that monitor checks internal _connected state"""
-        _connected = True
+        internal_disconnected = threading.Event()
         detected_disconnect = False
 
         def monitor_loop():
             nonlocal detected_disconnect
             for _ in range(10):
-                if not _connected:
+                # Poll interval that wakes as soon as the state changes
+                if internal_disconnected.wait(timeout=0.05):
                     detected_disconnect = True
                     break
-                time.sleep(0.05)
 
         thread = threading.Thread(target=monitor_loop)
         thread.start()
 
         # Simulate heartbeat thread setting _connected to False
-        time.sleep(0.1)
-        _connected = False
+        internal_disconnected.set()
 
         thread.join(timeout=1)
         assert detected_disconnect is True
@@ -83,13 +83,13 @@ def patched_config(mock_config: Dict[str, Any]):
 
 
 @pytest.fixture
-def mock_analysis_config() -> Dict[str, Any]:
+def mock_analysis_config(frozen_now: datetime) -> Dict[str, Any]:
     """
     Complete mock analysis configuration
 
     Matches the AnalysisConfig model structure
     """
-    now = datetime.now(timezone.utc)
+    now = frozen_now
 
     return {
         'config_id': 'config-test-001',
@@ -129,13 +129,13 @@ def mock_analysis_config() -> Dict[str, Any]:
 
 
 @pytest.fixture
-def mock_routing_rule_config() -> Dict[str, Any]:
+def mock_routing_rule_config(frozen_now: datetime) -> Dict[str, Any]:
     """
     Mock routing rule configuration
 
     Matches the RoutingRule model structure
     """
-    now = datetime.now(timezone.utc)
+    now = frozen_now
 
     return {
         'rule_id': 'rule-test-001',
@@ -206,13 +206,13 @@ def mock_edge_config() -> Dict[str, Any]:
 
 
 @pytest.fixture
-def mock_mongodb_instance_config() -> Dict[str, Any]:
+def mock_mongodb_instance_config(frozen_now: datetime) -> Dict[str, Any]:
     """
     Mock MongoDB instance configuration
 
     Matches the MongoDBInstance model structure
     """
-    now = datetime.now(timezone.utc)
+    now = frozen_now
 
     return {
         'instance_id': 'test-mongo-001',
@@ -233,13 +233,13 @@ def mock_mongodb_instance_config() -> Dict[str, Any]:
 
 
 @pytest.fixture
-def multiple_analysis_configs() -> List[Dict[str, Any]]:
+def multiple_analysis_configs(frozen_now: datetime) -> List[Dict[str, Any]]:
     """
     Multiple analysis configurations for testing
 
     Returns configs for different analysis methods
     """
-    now = datetime.now(timezone.utc)
+    now = frozen_now
 
     return [
         {
@@ -276,13 +276,13 @@ def multiple_analysis_configs() -> List[Dict[str, Any]]:
 
 
 @pytest.fixture
-def multiple_routing_rules() -> List[Dict[str, Any]]:
+def multiple_routing_rules(frozen_now: datetime) -> List[Dict[str, Any]]:
     """
     Multiple routing rules for testing priority and matching
 
     Returns rules with different conditions and priorities
     """
-    now = datetime.now(timezone.utc)
+    now = frozen_now
 
     return [
         {
@@ -7,8 +7,9 @@ Provides fixtures for:
 - Sample data collections
 - GridFS fixtures
 """
+import struct
 import pytest
-from typing import Dict, Any, List, Generator
+from typing import Dict, Any, List, Generator, NamedTuple
 from unittest.mock import MagicMock, patch, PropertyMock
 from datetime import datetime, timezone
 
@@ -19,6 +20,16 @@ from CI_test.mocks.mock_mongodb import (
     MockGridFS,
     MockGridFSBucket,
 )
+from CI_test.mocks.wav import build_silent_wav
+
+
+class WavProperties(NamedTuple):
+    """Header fields parsed from sample_wav_content"""
+    is_riff_wave: bool
+    audio_format: int
+    channels: int
+    sample_rate: int
+    data_size: int
 
 
 @pytest.fixture
@@ -97,13 +108,13 @@ def mock_multi_mongodb_handler(mock_mongo_client: MockMongoClient) -> Generator[
 
 
 @pytest.fixture
-def sample_collection_data() -> Dict[str, List[Dict[str, Any]]]:
+def sample_collection_data(frozen_now: datetime) -> Dict[str, List[Dict[str, Any]]]:
     """
     Sample data for various collections
 
     Returns a dictionary with collection names as keys and lists of documents as values
     """
-    now = datetime.now(timezone.utc)
+    now = frozen_now
 
     return {
         'users': [
@@ -259,41 +270,55 @@ def mock_gridfs_bucket(mock_database: MockDatabase) -> MockGridFSBucket:
     return MockGridFSBucket(mock_database)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_wav_content() -> bytes:
     """
     Generate sample WAV file content
 
-    Returns minimal valid WAV file bytes
+    Returns minimal valid WAV file bytes (1 s, 16 kHz, mono). The bytes are
+    immutable, so one object is safely shared by every test in the session.
     """
-    import struct
-
-    sample_rate = 16000
-    duration = 1.0
-    num_samples = int(sample_rate * duration)
-
-    # WAV header
-    header = struct.pack(
-        '<4sI4s4sIHHIIHH4sI',
-        b'RIFF',
-        36 + num_samples * 2,
-        b'WAVE',
-        b'fmt ',
-        16,  # Subchunk1 size
-        1,   # PCM
-        1,   # Mono
-        sample_rate,
-        sample_rate * 2,
-        2,   # Block align
-        16,  # Bits per sample
-        b'data',
-        num_samples * 2,
-    )
+    return build_silent_wav(16000, 1, 1.0)
 
-    # Silent audio
-    audio_data = bytes(num_samples * 2)
 
-    return header + audio_data
+@pytest.fixture(scope="session")
+def wav_header_index(sample_wav_content: bytes) -> Dict[str, int]:
+    """
+    Offsets of the 'fmt ' and 'data' chunk IDs in sample_wav_content
+
+    Usage:
+        def test_parse(sample_wav_content, wav_header_index):
+            fmt_offset = wav_header_index['fmt']
+    """
+    return {
+        'fmt': sample_wav_content.find(b'fmt '),
+        'data': sample_wav_content.find(b'data'),
+    }
+
+
+@pytest.fixture(scope="session")
+def wav_properties(sample_wav_content: bytes, wav_header_index: Dict[str, int]) -> WavProperties:
+    """
+    sample_wav_content header parsed once per session
+
+    Usage:
+        def test_rate(wav_properties):
+            assert wav_properties.sample_rate == 16000
+    """
+    fmt_offset = wav_header_index['fmt']
+    data_offset = wav_header_index['data']
+    assert fmt_offset != -1 and data_offset != -1, "sample WAV is missing fmt/data chunk"
+
+    audio_format, channels, sample_rate = struct.unpack_from('<HHI', sample_wav_content, fmt_offset + 8)
+    data_size, = struct.unpack_from('<I', sample_wav_content, data_offset + 4)
+
+    return WavProperties(
+        is_riff_wave=sample_wav_content[:4] == b'RIFF' and sample_wav_content[8:12] == b'WAVE',
+        audio_format=audio_format,
+        channels=channels,
+        sample_rate=sample_rate,
+        data_size=data_size,
+    )
 
 
 @pytest.fixture
@@ -9,14 +9,17 @@ Provides comprehensive mocking of pymongo classes including:
 - GridFS / GridFSBucket
 - ChangeStream
 """
+import bisect
 import copy
 import fnmatch
+import itertools
 import re
 import threading
 import time
 import uuid
+from operator import itemgetter
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Iterator, Callable, Union
+from typing import Any, Dict, List, Optional, Iterable, Iterator, Callable, Union
 from bson import ObjectId
 
 
@@ -60,16 +63,21 @@ class MockCursor:
         result = {}
         include_mode = any(v == 1 for v in self._projection.values() if v != 0)
 
+        if include_mode:
+            # Only copy the requested fields instead of walking the whole document
+            if self._projection.get('_id', 1) != 0 and '_id' in doc:
+                result['_id'] = doc['_id']
+            for key, flag in self._projection.items():
+                if flag == 1 and key != '_id' and key in doc:
+                    result[key] = doc[key]
+            return result
+
         for key, value in doc.items():
             if key == '_id':
                 if self._projection.get('_id', 1) != 0:
                     result[key] = value
-            elif include_mode:
-                if self._projection.get(key, 0) == 1:
-                    result[key] = value
-            else:
-                if self._projection.get(key, 1) != 0:
-                    result[key] = value
+            elif self._projection.get(key, 1) != 0:
+                result[key] = value
 
         return result
 
@@ -199,6 +207,20 @@ class MockDeleteResult:
         self.acknowledged = acknowledged
 
 
+class MockBulkWriteResult:
+    """Mock result for bulk_write operation"""
+    def __init__(self, inserted_count: int = 0, matched_count: int = 0,
+                 modified_count: int = 0, deleted_count: int = 0,
+                 upserted_ids: Optional[Dict[int, Any]] = None, acknowledged: bool = True):
+        self.inserted_count = inserted_count
+        self.matched_count = matched_count
+        self.modified_count = modified_count
+        self.deleted_count = deleted_count
+        self.upserted_ids = upserted_ids or {}
+        self.upserted_count = len(self.upserted_ids)
+        self.acknowledged = acknowledged
+
+
 class MockCollection:
     """
     Mock MongoDB Collection with full CRUD support
@@ -208,6 +230,7 @@ class MockCollection:
     - insert_one, insert_many
     - update_one, update_many
     - delete_one, delete_many
+    - bulk_write (InsertOne, UpdateOne, UpdateMany, DeleteOne, DeleteMany)
     - count_documents, estimated_document_count
     - create_index, drop_index
     - watch (change streams)
@@ -219,6 +242,10 @@ class MockCollection:
         self.database = database
         self._documents: List[Dict[str, Any]] = []
         self._indexes: Dict[str, Dict] = {}
+        # Leading index fields: field -> value -> [(seq, doc)] in collection order
+        self._lookups: Dict[str, Dict[Any, List[tuple]]] = {}
+        # Insertion sequence numbers; an updated document keeps its number
+        self._seq = itertools.count()
         self._change_streams: List[MockChangeStream] = []
         self._lock = threading.Lock()
 
@@ -377,20 +404,102 @@ class MockCollection:
             current = current[k]
         current.pop(keys[-1], None)
 
+    def _lookup_insert(self, field: str, value: Any, entry: tuple) -> None:
+        """File a (seq, doc) entry under value, keeping the bucket in seq order"""
+        lookup = self._lookups.get(field)
+        if lookup is None:
+            # Dropped earlier in this pass for an unhashable value
+            return
+        try:
+            bucket = lookup.setdefault(value, [])
+        except TypeError:
+            # Unhashable values (arrays, sub-documents) need the full match rules
+            del self._lookups[field]
+            return
+        if bucket and bucket[-1][0] > entry[0]:
+            bisect.insort(bucket, entry, key=itemgetter(0))
+        else:
+            bucket.append(entry)
+
+    @staticmethod
+    def _lookup_pop(lookup: Dict[Any, list], value: Any, doc: Dict[str, Any]) -> Optional[tuple]:
+        """Remove doc from the bucket for value and return its (seq, doc) entry"""
+        try:
+            bucket = lookup.get(value, [])
+        except TypeError:
+            return None
+        for i, entry in enumerate(bucket):
+            if entry[1] is doc:
+                return bucket.pop(i)
+        return None
+
+    def _index_add(self, doc: Dict[str, Any], fields: Optional[List[str]] = None) -> None:
+        """Add a stored document to the index lookup tables (all of them by default)"""
+        entry = (next(self._seq), doc)
+        for field in list(self._lookups) if fields is None else fields:
+            self._lookup_insert(field, self._get_nested_value(doc, field), entry)
+
+    def _index_remove(self, doc: Dict[str, Any]) -> None:
+        """Remove a stored document from every index lookup table"""
+        for field, lookup in self._lookups.items():
+            self._lookup_pop(lookup, self._get_nested_value(doc, field), doc)
+
+    def _index_replace(self, old_doc: Dict[str, Any], new_doc: Dict[str, Any]) -> None:
+        """Swap an updated document into the indexes, keeping its collection position"""
+        for field, lookup in list(self._lookups.items()):
+            old_value = self._get_nested_value(old_doc, field)
+            new_value = self._get_nested_value(new_doc, field)
+            if old_value == new_value:
+                try:
+                    bucket = lookup.get(old_value, [])
+                except TypeError:
+                    continue
+                for i, (seq, indexed) in enumerate(bucket):
+                    if indexed is old_doc:
+                        bucket[i] = (seq, new_doc)
+                        break
+                continue
+            # Moving buckets keeps the old sequence number, so the document
+            # lands where its collection position says instead of at the end
+            entry = self._lookup_pop(lookup, old_value, old_doc)
+            if entry is not None:
+                self._lookup_insert(field, new_value, (entry[0], new_doc))
+
+    def _candidates(self, filter: Dict[str, Any]) -> Iterable[Dict[str, Any]]:
+        """Narrow a filter to an index bucket when it has an indexed equality"""
+        for field, condition in filter.items():
+            lookup = self._lookups.get(field)
+            if lookup is None or isinstance(condition, (dict, list)):
+                continue
+            try:
+                bucket = lookup.get(condition, [])
+            except TypeError:
+                continue
+            return (doc for _, doc in bucket)
+        return self._documents
+
     def find(self, filter: Optional[Dict] = None, projection: Optional[Dict] = None,
              *args, **kwargs) -> MockCursor:
         """Find documents matching filter"""
         filter = filter or {}
         with self._lock:
-            matched = [doc for doc in self._documents if self._match_query(doc, filter)]
+            matched = [doc for doc in self._candidates(filter) if self._match_query(doc, filter)]
         return MockCursor(matched, projection)
 
     def find_one(self, filter: Optional[Dict] = None, projection: Optional[Dict] = None,
                  sort: Optional[List] = None, *args, **kwargs) -> Optional[Dict[str, Any]]:
         """Find one document matching filter"""
+        if not sort:
+            # Without a sort order the first match wins, so stop scanning there
+            filter = filter or {}
+            with self._lock:
+                doc = next((d for d in self._candidates(filter) if self._match_query(d, filter)), None)
+            if doc is None:
+                return None
+            return next(iter(MockCursor([doc], projection)))
+
         cursor = self.find(filter, projection)
-        if sort:
-            cursor.sort(sort)
+        cursor.sort(sort)
         for doc in cursor:
             return doc
         return None
@@ -405,6 +514,7 @@ class MockCollection:
                     if not return_document:
                         original = copy.deepcopy(doc)
                     self._documents[i] = self._apply_update(doc, update)
+                    self._index_replace(doc, self._documents[i])
                     self._notify_change('update', self._documents[i])
                     return self._documents[i] if return_document else original
 
@@ -413,6 +523,7 @@ class MockCollection:
                 new_doc.update(filter)
                 new_doc = self._apply_update(new_doc, update)
                 self._documents.append(new_doc)
+                self._index_add(new_doc)
                 self._notify_change('insert', new_doc)
                 return new_doc if return_document else None
 
@@ -424,6 +535,7 @@ class MockCollection:
             for i, doc in enumerate(self._documents):
                 if self._match_query(doc, filter):
                     deleted = self._documents.pop(i)
+                    self._index_remove(deleted)
                     self._notify_change('delete', deleted)
                     return deleted
         return None
@@ -436,17 +548,25 @@ class MockCollection:
 
         with self._lock:
             self._documents.append(doc)
+            self._index_add(doc)
             self._notify_change('insert', doc)
 
         return MockInsertOneResult(doc['_id'])
 
     def insert_many(self, documents: List[Dict[str, Any]], *args, **kwargs) -> MockInsertManyResult:
         """Insert multiple documents"""
-        inserted_ids = []
-        for document in documents:
-            result = self.insert_one(document)
-            inserted_ids.append(result.inserted_id)
-        return MockInsertManyResult(inserted_ids)
+        docs = [copy.deepcopy(document) for document in documents]
+        for doc in docs:
+            if '_id' not in doc:
+                doc['_id'] = ObjectId()
+
+        with self._lock:
+            self._documents.extend(docs)
+            for doc in docs:
+                self._index_add(doc)
+                self._notify_change('insert', doc)
+
+        return MockInsertManyResult([doc['_id'] for doc in docs])
 
     def update_one(self, filter: Dict, update: Dict, upsert: bool = False,
                    *args, **kwargs) -> MockUpdateResult:
@@ -455,6 +575,7 @@ class MockCollection:
             for i, doc in enumerate(self._documents):
                 if self._match_query(doc, filter):
                     self._documents[i] = self._apply_update(doc, update)
+                    self._index_replace(doc, self._documents[i])
                     self._notify_change('update', self._documents[i])
                     return MockUpdateResult(1, 1)
 
@@ -463,6 +584,7 @@ class MockCollection:
                 new_doc.update(filter)
                 new_doc = self._apply_update(new_doc, update)
                 self._documents.append(new_doc)
+                self._index_add(new_doc)
                 self._notify_change('insert', new_doc)
                 return MockUpdateResult(0, 0, new_doc['_id'])
 
@@ -480,6 +602,7 @@ class MockCollection:
                     matched += 1
                     old_doc = copy.deepcopy(doc)
                     self._documents[i] = self._apply_update(doc, update)
+                    self._index_replace(doc, self._documents[i])
                     if self._documents[i] != old_doc:
                         modified += 1
                         self._notify_change('update', self._documents[i])
@@ -492,6 +615,7 @@ class MockCollection:
             for i, doc in enumerate(self._documents):
                 if self._match_query(doc, filter):
                     deleted = self._documents.pop(i)
+                    self._index_remove(deleted)
                     self._notify_change('delete', deleted)
                     return MockDeleteResult(1)
         return MockDeleteResult(0)
@@ -507,11 +631,60 @@ class MockCollection:
 
             for i in reversed(to_delete):
                 deleted = self._documents.pop(i)
+                self._index_remove(deleted)
                 self._notify_change('delete', deleted)
                 deleted_count += 1
 
         return MockDeleteResult(deleted_count)
 
+    @staticmethod
+    def _bulk_request_fields(request: Any) -> tuple:
+        """
+        (operation name, filter, document, upsert) of a pymongo write request
+
+        pymongo exposes no public accessors for these, so this is the one
+        place that reads its _filter/_doc/_upsert attributes.
+        """
+        return (
+            type(request).__name__,
+            getattr(request, '_filter', None),
+            getattr(request, '_doc', None),
+            bool(getattr(request, '_upsert', False)),
+        )
+
+    def bulk_write(self, requests: List[Any], ordered: bool = True,
+                   *args, **kwargs) -> MockBulkWriteResult:
+        """
+        Apply a batch of pymongo write operations
+
+        Requests are applied in list order whether or not ordered is set.
+        InsertOne, UpdateOne/UpdateMany and DeleteOne/DeleteMany are supported;
+        any other request type (e.g. ReplaceOne) raises TypeError.
+        """
+        result = MockBulkWriteResult()
+
+        for index, request in enumerate(requests):
+            op, filter, doc, upsert = self._bulk_request_fields(request)
+            if op == 'InsertOne':
+                self.insert_one(doc)
+                result.inserted_count += 1
+            elif op in ('UpdateOne', 'UpdateMany'):
+                update = self.update_one if op == 'UpdateOne' else self.update_many
+                outcome = update(filter, doc, upsert=upsert)
+                result.matched_count += outcome.matched_count
+                result.modified_count += outcome.modified_count
+                if outcome.upserted_id is not None:
+                    result.upserted_ids[index] = outcome.upserted_id
+            elif op in ('DeleteOne', 'DeleteMany'):
+                delete = self.delete_one if op == 'DeleteOne' else self.delete_many
+                result.deleted_count += delete(filter).deleted_count
+            else:
+                raise TypeError(
+                    f"MockCollection.bulk_write does not support {op} requests: {request!r}"
+                )
+        result.upserted_count = len(result.upserted_ids)
+        return result
+
     def count_documents(self, filter: Optional[Dict] = None, *args, **kwargs) -> int:
         """Count documents matching filter"""
         filter = filter or {}
@@ -545,11 +718,28 @@ class MockCollection:
             'keys': keys,
             'options': kwargs,
         }
+
+        # Equality on an index prefix is served from a hash table on its leading field
+        field = self._leading_field(keys)
+        if field not in self._lookups:
+            with self._lock:
+                self._lookups[field] = {}
+                for doc in self._documents:
+                    self._index_add(doc, [field])
         return index_name
 
+    @staticmethod
+    def _leading_field(keys: Union[str, List]) -> str:
+        """First field of an index specification"""
+        return keys if isinstance(keys, str) else keys[0][0]
+
     def drop_index(self, index_name: str) -> None:
         """Drop an index"""
-        self._indexes.pop(index_name, None)
+        info = self._indexes.pop(index_name, None)
+        if info is not None:
+            field = self._leading_field(info['keys'])
+            if all(self._leading_field(other['keys']) != field for other in self._indexes.values()):
+                self._lookups.pop(field, None)
 
     def list_indexes(self) -> List[Dict]:
         """List all indexes"""
@@ -602,6 +792,7 @@ class MockCollection:
         with self._lock:
             self._documents.clear()
             self._indexes.clear()
+            self._lookups.clear()
 
 
 class MockDatabase:
@@ -706,6 +897,11 @@ class MockMongoClient:
         """Close the client"""
         pass
 
+    def _reset(self) -> None:
+        """Drop every database, keeping the client itself"""
+        with self._lock:
+            self._databases.clear()
+
     def drop_database(self, name: str) -> None:
         """Drop a database"""
         with self._lock:
@@ -758,6 +954,11 @@ class MockGridFS:
         self._files: Dict[Any, MockGridFSFile] = {}
         self._lock = threading.Lock()
 
+    def _reset(self) -> None:
+        """Remove every stored file"""
+        with self._lock:
+            self._files.clear()
+
     def put(self, data: bytes, filename: str = None, **kwargs) -> ObjectId:
         """Store file in GridFS"""
         file_id = ObjectId()
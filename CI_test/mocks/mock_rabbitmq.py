@@ -91,6 +91,14 @@ class MockQueue:
             message.delivery_info.delivery_tag = self._delivery_tag_counter
             self._messages.append(message)
 
+    def put_many(self, messages: List[MockMessage]) -> None:
+        """Add several messages to queue under one lock acquisition"""
+        with self._lock:
+            for message in messages:
+                self._delivery_tag_counter += 1
+                message.delivery_info.delivery_tag = self._delivery_tag_counter
+            self._messages.extend(messages)
+
     def get(self) -> Optional[MockMessage]:
         """Get message from queue (non-blocking)"""
         with self._lock:
@@ -228,6 +236,18 @@ class MockChannel:
         """Close the channel"""
         self._is_open = False
 
+    def _reset(self) -> None:
+        """Return to the just-constructed state, reusing the containers"""
+        with self._lock:
+            self._queues.clear()
+            self._exchanges.clear()
+            self._consumer_callbacks.clear()
+            self._published_messages.clear()
+            self._prefetch_count = 0
+            self._is_open = True
+            self._consumer_tag_counter = 0
+            self._exchanges[''] = MockExchange('', 'direct')
+
     # Queue operations
     def queue_declare(self, queue: str = '', durable: bool = False,
                       exclusive: bool = False, auto_delete: bool = False,
@@ -320,6 +340,37 @@ class MockChannel:
         if not exchange and routing_key in self._queues:
             self._queues[routing_key].put(message)
 
+    def basic_publish_batch(self, exchange: str, routing_key: str, bodies: List[bytes],
+                            properties: Optional[MockBasicProperties] = None) -> None:
+        """
+        Publish several bodies to the same exchange/routing key in one call
+
+        Stands in for a batch of basic_publish calls inside one publisher
+        confirm window (confirm_delivery) on a real pika channel.
+        """
+        messages = [
+            MockMessage(
+                body=body,
+                # A fresh default per message, as basic_publish builds one per call
+                properties=properties or MockBasicProperties(),
+                delivery_info=MockDeliveryInfo(exchange=exchange, routing_key=routing_key),
+            )
+            for body in bodies
+        ]
+
+        self._published_messages.extend(messages)
+
+        # Resolve target queues once for the whole batch
+        queue_names = []
+        target_exchange = self._exchanges.get(exchange, self._exchanges.get(''))
+        if target_exchange:
+            queue_names.extend(target_exchange.get_bound_queues(routing_key))
+        if not exchange:
+            queue_names.append(routing_key)
+        for queue_name in queue_names:
+            if queue_name in self._queues:
+                self._queues[queue_name].put_many(messages)
+
     # Consuming
     def basic_consume(self, queue: str, on_message_callback: Callable,
                       auto_ack: bool = False, exclusive: bool = False,
@@ -483,6 +534,12 @@ class MockConnection:
         for ch in self._channels:
             ch.close()
 
+    def _reset(self) -> None:
+        """Reopen and drop channels opened since construction"""
+        self._is_open = True
+        del self._channels[1:]
+        self._channel._reset()
+
     def process_data_events(self, time_limit: float = 0) -> None:
         """Process data events (for testing)"""
         # In real implementation, this would process network I/O
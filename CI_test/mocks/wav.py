@@ -0,0 +1,53 @@
+"""
+Silent PCM WAV helpers shared by the test fixtures and the audio mocks
+"""
+import struct
+from functools import lru_cache
+
+# 44-byte canonical PCM WAV header, compiled once
+WAV_HEADER = struct.Struct('<4sI4s4sIHHIIHH4sI')
+
+
+@lru_cache(maxsize=None)
+def pack_wav_header(num_frames: int, sample_rate: int, channels: int = 1) -> bytes:
+    """Pack the header of a 16-bit PCM WAV file holding num_frames frames (memoized)"""
+    block_align = channels * 2
+    data_size = num_frames * block_align
+
+    return WAV_HEADER.pack(
+        b'RIFF',
+        36 + data_size,  # File size - 8
+        b'WAVE',
+        b'fmt ',
+        16,  # Subchunk1 size
+        1,   # Audio format (PCM)
+        channels,
+        sample_rate,
+        sample_rate * block_align,  # Byte rate
+        block_align,
+        16,  # Bits per sample
+        b'data',
+        data_size,
+    )
+
+
+def build_silent_wav(sample_rate: int, channels: int, duration: float) -> bytes:
+    """Build the bytes of a 16-bit PCM WAV file holding duration seconds of silence"""
+    num_frames = int(sample_rate * duration)
+    return pack_wav_header(num_frames, sample_rate, channels) + bytes(num_frames * channels * 2)
+
+
+def write_silent_wav(filepath: str, num_frames: int, sample_rate: int, channels: int = 1) -> bytes:
+    """
+    Write a 16-bit PCM WAV file of silence and return its header
+
+    Only the header is written; extending the file zero-fills the payload
+    without building it in Python.
+    """
+    header = pack_wav_header(num_frames, sample_rate, channels)
+
+    with open(filepath, 'wb') as f:
+        f.write(header)
+        f.truncate(len(header) + num_frames * channels * 2)
+
+    return header
@@ -80,6 +80,16 @@ class TestIndexCreation:
         )
         assert index_name is not None
 
+    @pytest.mark.unit
+    def test_create_index_on_array_field(self, mock_collection):
+        """Test indexing a field that holds arrays in several documents"""
+        mock_collection.insert_many([{'tags': ['a']}, {'tags': ['b']}])
+
+        index_name = mock_collection.create_index('tags')
+
+        assert index_name is not None
+        assert mock_collection.count_documents({'tags': 'b'}) == 1
+
     @pytest.mark.unit
     def test_list_indexes(self, mock_collection):
         """Test listing collection indexes"""